@@ -21,6 +21,10 @@ class MainWindowBridge:
     def has_data(self) -> bool:
         return self._mw._data is not None
 
+    def when_ready(self, callback):
+        """Call *callback* once pending baseline results have been applied."""
+        self._mw.when_baseline_ready(callback)
+
     # -- Data reading --------------------------------------------------------
 
     def get_experiment_info(self) -> dict:
@@ -28,7 +32,7 @@ class MainWindowBridge:
         return {
             "experiment_name": d.experiment_name,
             "num_wells": len(d.wells),
-            "wells": d.wells,
+            "wells": list(d.wells),
             "channels": d.channels,
             "num_cycles": d.num_cycles,
             "sample_names": {w: n for w, n in d.sample_names.items() if n},
@@ -43,7 +47,7 @@ class MainWindowBridge:
             channels = [d.channels[0]] if d.channels else []
 
         valid_channels = [c for c in channels if c in d.channels]
-        valid_wells = [w for w in wells if w in d.wells]
+        valid_wells = [w for w in wells if w in d.well_idx]
 
         result = {}
         for well in valid_wells:
@@ -53,7 +57,7 @@ class MainWindowBridge:
                 "channels": {},
             }
             for ch in valid_channels:
-                raw = d.fluorescence.get(well, {}).get(ch)
+                raw = d.fluorescence_of(well, ch)
                 if raw is None:
                     continue
                 ch_info: dict = {
@@ -73,11 +77,11 @@ class MainWindowBridge:
 
                 # Baseline results if available
                 if br:
-                    ch_info["ct"] = br.ct.get(well, {}).get(ch)
+                    ch_info["ct"] = br.ct_of(well, ch)
                     if ch_info["ct"] is not None:
                         ch_info["ct"] = round(ch_info["ct"], 2)
-                    ch_info["call"] = br.call.get(well, {}).get(ch, "N/A")
-                    rfi = br.endpoint_rfi.get(well, {}).get(ch)
+                    ch_info["call"] = br.call_of(well, ch)
+                    rfi = br.endpoint_rfi_of(well, ch)
                     if rfi is not None:
                         ch_info["endpoint_rfi"] = round(float(rfi), 3)
 
@@ -88,7 +92,7 @@ class MainWindowBridge:
     # -- Well activation -----------------------------------------------------
 
     def set_wells_inactive(self, wells: list[str]) -> dict:
-        well_set = set(wells) & set(self._mw._data.wells)
+        well_set = {w for w in wells if w in self._mw._data.well_idx}
         self._mw._inactive_wells |= well_set
         self._mw._push_inactive()
         return {"inactivated": sorted(well_set)}
@@ -105,9 +109,10 @@ class MainWindowBridge:
         qcolor = QColor(color)
         if not qcolor.isValid():
             return {"error": f"Invalid color: {color}"}
-        for w in wells:
-            if w in self._mw._data.wells:
-                self._mw._color_settings.sample_colors[w] = QColor(qcolor)
+        well_idx = self._mw._data.well_idx
+        self._mw._color_settings.sample_colors.update(
+            dict.fromkeys((w for w in wells if w in well_idx), qcolor)
+        )
         self._mw._push_colors()
         return {"colored": sorted(wells), "color": color}
 
@@ -138,12 +143,8 @@ class MainWindowBridge:
         return {"checked_channels": channels}
 
     def select_wells(self, wells: list[str]) -> dict:
-        well_set = set(wells) & set(self._mw._data.wells)
-        self._mw._syncing = True
-        self._mw.plate_map.set_selection(well_set)
-        self._mw.sample_table.set_selection(well_set)
-        self._mw.curve_viewer.set_selected_wells(well_set)
-        self._mw._syncing = False
+        well_set = {w for w in wells if w in self._mw._data.well_idx}
+        self._mw._apply_selection(well_set)
         self._mw._update_status()
         return {"selected": sorted(well_set)}
 
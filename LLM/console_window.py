@@ -6,6 +6,7 @@ import json
 import sys
 import threading
 import traceback
+from functools import partial
 from typing import TYPE_CHECKING
 
 from PySide6.QtWidgets import (
@@ -132,29 +133,8 @@ class LLMConsoleWindow(QWidget):
 
         if parsed.function_calls:
             _dbg(f"_on_response: processing {len(parsed.function_calls)} function call(s)")
-            results: list[tuple[str, dict]] = []
-            for fc in parsed.function_calls:
-                _dbg(f"_on_response: calling {fc.name}({list(fc.args.keys())})")
-                self._append_function_call(fc.name, fc.args)
-
-                fn = FUNCTION_MAP.get(fc.name)
-                if fn:
-                    try:
-                        result = fn(self._bridge, **fc.args)
-                        _dbg(f"_on_response: {fc.name} returned OK, "
-                             f"keys={list(result.keys()) if isinstance(result, dict) else '?'}")
-                    except Exception as exc:
-                        _dbg(f"_on_response: {fc.name} raised: {exc}")
-                        result = {"error": str(exc)}
-                else:
-                    _dbg(f"_on_response: unknown function {fc.name}")
-                    result = {"error": f"Unknown function: {fc.name}"}
-
-                self._append_function_result(fc.name, result)
-                results.append((fc.name, result))
-
-            _dbg(f"_on_response: sending {len(results)} function result(s) back to API")
-            self._call_api(results, is_function_result=True)
+            self._bridge.when_ready(
+                partial(self._run_function_calls, list(parsed.function_calls), []))
             return
 
         text = "\n".join(parsed.text_parts) if parsed.text_parts else "(no response)"
@@ -162,6 +142,39 @@ class LLMConsoleWindow(QWidget):
         self._append_assistant(text)
         self._set_busy(False)
 
+    def _run_function_calls(self, pending: list, results: list[tuple[str, dict]]):
+        """Run the next pending call, then continue once the app is ready.
+
+        A call such as a baseline settings change starts a background
+        recompute; the following call (and the reply to the API) waits for
+        its results without blocking the event loop.
+        """
+        if not pending:
+            _dbg(f"_run_function_calls: sending {len(results)} function result(s) back to API")
+            self._call_api(results, is_function_result=True)
+            return
+
+        fc = pending.pop(0)
+        _dbg(f"_run_function_calls: calling {fc.name}({list(fc.args.keys())})")
+        self._append_function_call(fc.name, fc.args)
+
+        fn = FUNCTION_MAP.get(fc.name)
+        if fn:
+            try:
+                result = fn(self._bridge, **fc.args)
+                _dbg(f"_run_function_calls: {fc.name} returned OK, "
+                     f"keys={list(result.keys()) if isinstance(result, dict) else '?'}")
+            except Exception as exc:
+                _dbg(f"_run_function_calls: {fc.name} raised: {exc}")
+                result = {"error": str(exc)}
+        else:
+            _dbg(f"_run_function_calls: unknown function {fc.name}")
+            result = {"error": f"Unknown function: {fc.name}"}
+
+        self._append_function_result(fc.name, result)
+        results.append((fc.name, result))
+        self._bridge.when_ready(partial(self._run_function_calls, pending, results))
+
     def _on_error(self, error_text: str):
         _dbg(f"_on_error: {error_text[:200]}")
         self._update_token_label()
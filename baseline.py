@@ -1,6 +1,9 @@
 """Baseline correction, Ct calculation, and Call determination for qPCR data."""
 
-from dataclasses import dataclass, field
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 
 import numpy as np
 from PySide6.QtWidgets import (
@@ -24,101 +27,294 @@ class BaselineSettings:
     call_threshold: float = 1.5  # RFI at endpoint for positive call
 
 
+# Call codes stored in BaselineResults.call
+CALL_NA = 0
+CALL_NEGATIVE = 1
+CALL_POSITIVE = 2
+CALL_LABELS = ("N/A", "Negative", "Positive")
+
+
 @dataclass
 class BaselineResults:
-    """Precomputed baseline correction results for all wells/channels."""
-    # subtracted[well][channel] = fluorescence - baseline
-    subtracted: dict[str, dict[str, np.ndarray]] = field(default_factory=dict)
-    # divided[well][channel] = fluorescence / baseline, or None if baseline has zeros
-    divided: dict[str, dict[str, np.ndarray | None]] = field(default_factory=dict)
-    # ct[well][channel] = Ct value or None
-    ct: dict[str, dict[str, float | None]] = field(default_factory=dict)
-    # call[well][channel] = "Positive" | "Negative" | "N/A"
-    call: dict[str, dict[str, str]] = field(default_factory=dict)
-    # endpoint_rfi[well][channel] = divided value at last cycle, or None
-    endpoint_rfi: dict[str, dict[str, float | None]] = field(default_factory=dict)
+    """Precomputed baseline correction results for all wells/channels.
+
+    Results are stored as arrays indexed by ``(well_idx, channel_idx)``
+    (plus a trailing cycle axis for curves), in the order of ``wells`` and
+    ``channels``. Use the ``*_of`` accessors for lookups by name.
+
+    The curve arrays are read-only, so the views returned by
+    ``subtracted_of``/``divided_of`` can be shared without copying; a
+    missing curve is just a zero row of ``subtracted``.
+    """
+    wells: list[str] = field(default_factory=list)
+    channels: list[str] = field(default_factory=list)
+    well_idx: dict[str, int] = field(default_factory=dict)
+    channel_idx: dict[str, int] = field(default_factory=dict)
+    # subtracted[w, c] = fluorescence - baseline, shape (W, C, T), float32
+    subtracted: np.ndarray = field(default_factory=lambda: np.empty((0, 0, 0), dtype=np.float32))
+    # divided[w, c] = fluorescence / baseline, NaN where not divided_valid
+    divided: np.ndarray = field(default_factory=lambda: np.empty((0, 0, 0), dtype=np.float32))
+    # divided_valid[w, c] = False if the curve is missing or its baseline has zeros
+    divided_valid: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=bool))
+    # ct[w, c] = Ct value, NaN if none
+    ct: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.float32))
+    # call[w, c] = CALL_NA | CALL_NEGATIVE | CALL_POSITIVE
+    call: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.int8))
+    # endpoint_rfi[w, c] = divided value at last cycle, NaN if none
+    endpoint_rfi: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.float32))
+    # Copy of the settings these results were computed with
+    settings: BaselineSettings | None = None
+
+    def _index(self, well: str, channel: str) -> tuple[int, int] | None:
+        w = self.well_idx.get(well)
+        c = self.channel_idx.get(channel)
+        if w is None or c is None:
+            return None
+        return w, c
+
+    def subtracted_of(self, well: str, channel: str) -> np.ndarray | None:
+        idx = self._index(well, channel)
+        return None if idx is None else self.subtracted[idx]
+
+    def divided_of(self, well: str, channel: str) -> np.ndarray | None:
+        idx = self._index(well, channel)
+        if idx is None or not self.divided_valid[idx]:
+            return None
+        return self.divided[idx]
+
+    def ct_of(self, well: str, channel: str) -> float | None:
+        idx = self._index(well, channel)
+        if idx is None or np.isnan(self.ct[idx]):
+            return None
+        return float(self.ct[idx])
+
+    def call_of(self, well: str, channel: str) -> str:
+        idx = self._index(well, channel)
+        return "N/A" if idx is None else CALL_LABELS[self.call[idx]]
+
+    def endpoint_rfi_of(self, well: str, channel: str) -> float | None:
+        idx = self._index(well, channel)
+        if idx is None or np.isnan(self.endpoint_rfi[idx]):
+            return None
+        return float(self.endpoint_rfi[idx])
+
+    def ct_call_by_well(self, channel: str,
+                        ) -> tuple[dict[str, float | None], dict[str, str]]:
+        """Ct and Call of every well for one channel, read column-wise.
+
+        Equivalent to calling :meth:`ct_of` / :meth:`call_of` per well.
+        """
+        c = self.channel_idx.get(channel)
+        if c is None:
+            return dict.fromkeys(self.wells), dict.fromkeys(self.wells, "N/A")
+        cts = [None if ct != ct else ct for ct in self.ct[:, c].tolist()]
+        calls = [CALL_LABELS[k] for k in self.call[:, c].tolist()]
+        return dict(zip(self.wells, cts)), dict(zip(self.wells, calls))
 
 
 # ---------------------------------------------------------------------------
 # Computation
 # ---------------------------------------------------------------------------
 
+# Curves are processed in blocks of this many rows (~90 KB per 45-cycle
+# array), keeping each block cache-resident through all of its passes.
+_ROWS_PER_JOB = 512
+# Stacks smaller than this (a 384-well plate with 6 channels is 2304 rows)
+# run inline; below it, handing blocks to threads costs more than it saves.
+_THREADED_MIN_ROWS = 4 * _ROWS_PER_JOB
+
+
+@lru_cache(maxsize=1)
+def _executor() -> ThreadPoolExecutor:
+    """Worker threads shared by every large ``compute_baseline`` call."""
+    return ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                              thread_name_prefix="baseline")
+
+
 def compute_baseline(data: LC480Data, settings: BaselineSettings) -> BaselineResults:
-    """Compute baseline correction, Ct, and Call for all wells and channels."""
-    results = BaselineResults()
+    """Compute baseline correction, Ct, and Call for all wells and channels.
 
+    All curves are stacked into one ``(W * C, num_cycles)`` array so the
+    baseline fit and the subtract/divide steps run as single NumPy
+    operations instead of once per well/channel. Missing curves are left
+    as zeros, which gives a zero subtracted curve and an invalid divided
+    curve, as before.
+    """
     if not data or not data.wells:
-        return results
+        return BaselineResults()
 
-    cycles = data.cycles  # np.array([1, 2, ..., num_cycles])
+    wells = list(data.wells)
+    channels = list(data.channels)
     start_idx = settings.start_cycle - 1  # 0-based inclusive
     end_idx = settings.end_cycle           # 0-based exclusive (so end_cycle is inclusive)
+    ctx = _fit_context(len(data.cycles), start_idx, end_idx)
+
+    shape = (len(wells), len(channels))
+    y = _stacked_curves(data)  # (N, num_cycles)
+
+    n = y.shape[0]
+    subtracted = np.empty_like(y)
+    divided = np.empty_like(y)
+    valid = np.empty(n, dtype=bool)
+    ct = np.empty(n, dtype=np.float32)
+    call = np.empty(n, dtype=np.int8)
+
+    def run(rows: slice):
+        _baseline_rows(
+            y[rows], ctx, start_idx, end_idx, settings,
+            subtracted[rows], divided[rows], valid[rows], ct[rows], call[rows],
+        )
 
-    for well in data.wells:
-        results.subtracted[well] = {}
-        results.divided[well] = {}
-        results.ct[well] = {}
-        results.call[well] = {}
-        results.endpoint_rfi[well] = {}
-
-        for channel in data.channels:
-            fluor = data.fluorescence.get(well, {}).get(channel)
-            if fluor is None:
-                results.subtracted[well][channel] = np.zeros_like(cycles, dtype=float)
-                results.divided[well][channel] = None
-                results.ct[well][channel] = None
-                results.call[well][channel] = "N/A"
-                results.endpoint_rfi[well][channel] = None
-                continue
-
-            # Fit linear baseline to the baseline region
-            fit_x = cycles[start_idx:end_idx]
-            fit_y = fluor[start_idx:end_idx]
-            slope, intercept = np.polyfit(fit_x, fit_y, 1)
-            baseline_curve = slope * cycles + intercept
-
-            # Subtracted
-            results.subtracted[well][channel] = fluor - baseline_curve
-
-            # Divided (with zero check)
-            if np.any(baseline_curve == 0):
-                results.divided[well][channel] = None
-                results.ct[well][channel] = None
-                results.call[well][channel] = "N/A"
-                results.endpoint_rfi[well][channel] = None
-            else:
-                divided = fluor / baseline_curve
-                results.divided[well][channel] = divided
-
-                # Ct: first cycle where divided >= ct_threshold, with interpolation
-                results.ct[well][channel] = _calc_ct(divided, settings.ct_threshold)
-
-                # Call: endpoint RFI >= call_threshold
-                endpoint_rfi = float(divided[-1])
-                results.endpoint_rfi[well][channel] = endpoint_rfi
-                if endpoint_rfi >= settings.call_threshold:
-                    results.call[well][channel] = "Positive"
-                else:
-                    results.call[well][channel] = "Negative"
-
-    return results
-
-
-def _calc_ct(divided: np.ndarray, threshold: float) -> float | None:
-    """Find Ct with linear interpolation between cycles.
-
-    Cycles are 1-based: divided[0] = cycle 1, divided[i] = cycle i+1.
+    # Rows are independent: the stack is processed in contiguous blocks,
+    # spread over threads for large stacks (NumPy releases the GIL).
+    blocks = [slice(a, a + _ROWS_PER_JOB) for a in range(0, n, _ROWS_PER_JOB)]
+    if n >= _THREADED_MIN_ROWS and (os.cpu_count() or 1) > 1:
+        list(_executor().map(run, blocks))
+    else:
+        for rows in blocks:
+            run(rows)
+    # Shared with incremental updates, so frozen; views such as the
+    # endpoint column are taken afterwards and inherit the flag
+    for arr in (subtracted, divided, valid):
+        arr.flags.writeable = False
+    endpoint_rfi = divided[:, -1]
+
+    return BaselineResults(
+        wells=wells,
+        channels=channels,
+        well_idx=data.well_idx,
+        channel_idx=data.channel_idx,
+        subtracted=subtracted.reshape(shape + (-1,)),
+        divided=divided.reshape(shape + (-1,)),
+        divided_valid=valid.reshape(shape),
+        ct=ct.reshape(shape),
+        call=call.reshape(shape),
+        endpoint_rfi=endpoint_rfi.reshape(shape),
+        settings=replace(settings),
+    )
+
+
+def compute_baseline_incremental(previous: BaselineResults | None,
+                                 data: LC480Data,
+                                 settings: BaselineSettings) -> BaselineResults:
+    """Update *previous* results of *data* for new *settings*.
+
+    If the baseline region is unchanged only the thresholds can differ, so
+    the subtracted/divided curves are reused and just Ct and Call are
+    recomputed. Otherwise (or without previous results) this is a full
+    :func:`compute_baseline`.
+    """
+    old = previous.settings if previous is not None else None
+    if (old is None
+            or old.start_cycle != settings.start_cycle
+            or old.end_cycle != settings.end_cycle):
+        return compute_baseline(data, settings)
+
+    shape = previous.ct.shape
+    divided = previous.divided.reshape(-1, previous.divided.shape[-1])
+    ct = np.empty(divided.shape[0], dtype=np.float32)
+    call = np.empty(divided.shape[0], dtype=np.int8)
+    _ct_call_rows(divided, previous.divided_valid.ravel(), settings, ct, call)
+    return replace(
+        previous,
+        ct=ct.reshape(shape),
+        call=call.reshape(shape),
+        settings=replace(settings),
+    )
+
+
+@lru_cache(maxsize=16)
+def _fit_context(num_cycles: int, start_idx: int,
+                 end_idx: int) -> tuple[np.ndarray, np.ndarray, float]:
+    """Return the x-only terms of the baseline fit for a cycle range.
+
+    Returns ``(x_offset, dx, denom)``: all cycles minus the fit-region mean,
+    the centred fit-region cycles and their sum of squares. The arrays are
+    shared between calls and therefore read-only.
+    """
+    # float32 is ample for detector readings and halves memory traffic
+    cycles = np.arange(1, num_cycles + 1, dtype=np.float32)
+    fit_x = cycles[start_idx:end_idx]
+    x_mean = fit_x.mean()
+    dx = fit_x - x_mean
+    x_offset = cycles - x_mean
+    dx.flags.writeable = False
+    x_offset.flags.writeable = False
+    return x_offset, dx, float((dx * dx).sum())
+
+
+def _stacked_curves(data: LC480Data) -> np.ndarray:
+    """Return all curves of *data* as a ``(W * C, T)`` float32 array.
+
+    A view of ``data.fluo`` when possible; unmeasured (NaN) curves become
+    zero rows.
+    """
+    y = data.fluo.reshape(-1, data.fluo.shape[2]).astype(np.float32, copy=False)
+    missing = np.isnan(y)
+    if missing.any():
+        y = np.where(missing, np.float32(0), y)
+    return y
+
+
+def _baseline_rows(y: np.ndarray, ctx: tuple[np.ndarray, np.ndarray, float],
+                   start_idx: int, end_idx: int, settings: BaselineSettings,
+                   subtracted: np.ndarray, divided: np.ndarray,
+                   valid: np.ndarray, ct: np.ndarray, call: np.ndarray):
+    """Baseline-correct a block of stacked curves, writing into the outputs.
+
+    The fitted baseline is built in the ``subtracted`` buffer and every
+    step writes into its output in place, so no block-sized temporaries
+    are allocated.
+    """
+    # Closed-form least-squares line through the baseline region of every
+    # curve; the x-only terms come from _fit_context.
+    x_offset, dx, denom = ctx
+    fit_y = y[:, start_idx:end_idx]
+    y_mean = fit_y.mean(axis=1)
+    slope = ((fit_y - y_mean[:, None]) @ dx) / denom
+    baseline = subtracted
+    np.multiply(slope[:, None], x_offset[None, :], out=baseline)
+    baseline += y_mean[:, None]
+
+    # Divided (with zero check), then subtract over the baseline in place
+    np.logical_not((baseline == 0).any(axis=1), out=valid)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(y, baseline, out=divided)
+    np.subtract(y, baseline, out=subtracted)
+    divided[~valid] = np.nan
+
+    _ct_call_rows(divided, valid, settings, ct, call)
+
+
+def _ct_call_rows(divided: np.ndarray, valid: np.ndarray,
+                  settings: BaselineSettings, ct: np.ndarray, call: np.ndarray):
+    """Determine Ct and Call for a block of divided curves into the outputs."""
+    # Ct: first cycle where divided >= ct_threshold, with interpolation
+    ct[:] = _calc_ct_rows(divided, settings.ct_threshold)
+    # Call: endpoint RFI >= call_threshold
+    call[:] = np.where(divided[:, -1] >= settings.call_threshold,
+                       CALL_POSITIVE, CALL_NEGATIVE)
+    call[~valid] = CALL_NA
+
+
+def _calc_ct_rows(divided: np.ndarray, threshold: float) -> np.ndarray:
+    """Find Ct for each row of a ``(N, num_cycles)`` array.
+
+    The Ct is linearly interpolated between the last cycle below and the
+    first cycle at or above *threshold*.  Cycles are 1-based:
+    ``divided[:, 0]`` is cycle 1.  Returns one Ct per row, NaN where the
+    row never reaches *threshold*.
     """
-    for i in range(len(divided)):
-        if divided[i] >= threshold:
-            if i == 0:
-                return 1.0
-            y_prev = divided[i - 1]
-            y_curr = divided[i]
-            fraction = (threshold - y_prev) / (y_curr - y_prev)
-            # Cycle at index i-1 is (i), at index i is (i+1)
-            return float(i) + fraction
-    return None
+    crossed = divided >= threshold
+    first = crossed.argmax(axis=1)
+    rows = np.arange(divided.shape[0])
+    y_prev = divided[rows, np.maximum(first - 1, 0)]
+    y_curr = divided[rows, first]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fraction = (threshold - y_prev) / (y_curr - y_prev)
+    ct = np.where(first == 0, 1.0, first + fraction).astype(divided.dtype)
+    ct[~crossed.any(axis=1)] = np.nan
+    return ct
 
 
 # ---------------------------------------------------------------------------
@@ -1,7 +1,7 @@
 """Color compensation for qPCR multiplex cross-talk correction."""
 
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 import numpy as np
@@ -12,7 +12,10 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
-from baseline import BaselineResults, _calc_ct, BaselineSettings
+from baseline import (
+    BaselineResults, BaselineSettings, _calc_ct_rows,
+    CALL_NA, CALL_NEGATIVE, CALL_POSITIVE,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -56,16 +59,13 @@ def apply_color_compensation(
     if not settings.enabled or not settings.rules:
         return baseline_results
 
-    # Deep-copy the divided dict so we don't mutate the original
-    new_divided: dict[str, dict[str, np.ndarray | None]] = {}
-    for well in wells:
-        new_divided[well] = {}
-        for ch in channels:
-            orig = baseline_results.divided.get(well, {}).get(ch)
-            if orig is not None:
-                new_divided[well][ch] = orig.copy()
-            else:
-                new_divided[well][ch] = None
+    channel_idx = baseline_results.channel_idx
+    well_rows = [baseline_results.well_idx[w] for w in wells
+                 if w in baseline_results.well_idx]
+
+    # Copy the divided array so we don't mutate the original
+    new_divided = baseline_results.divided.copy()
+    valid = baseline_results.divided_valid
 
     # Apply each rule
     channel_set = set(channels)
@@ -75,41 +75,34 @@ def apply_color_compensation(
         if rule.factor == 0.0:
             continue
 
-        for well in wells:
-            source = new_divided[well].get(rule.source_channel)
-            target = new_divided[well].get(rule.target_channel)
-            if source is None or target is None:
-                continue
-            target -= (source - 1.0) * rule.factor
+        t = channel_idx[rule.target_channel]
+        s = channel_idx[rule.source_channel]
+        rows = [w for w in well_rows if valid[w, s] and valid[w, t]]
+        new_divided[rows, t] -= (new_divided[rows, s] - 1.0) * rule.factor
 
     # Recompute Ct, Call, and endpoint_rfi for affected target channels
-    affected_channels = {r.target_channel for r in settings.rules if r.target_channel in channel_set}
-
-    new_ct = {}
-    new_call = {}
-    new_endpoint_rfi = {}
-    for well in wells:
-        new_ct[well] = dict(baseline_results.ct.get(well, {}))
-        new_call[well] = dict(baseline_results.call.get(well, {}))
-        new_endpoint_rfi[well] = dict(baseline_results.endpoint_rfi.get(well, {}))
-
-        for ch in affected_channels:
-            divided = new_divided[well].get(ch)
-            if divided is None:
-                new_ct[well][ch] = None
-                new_call[well][ch] = "N/A"
-                new_endpoint_rfi[well][ch] = None
-            else:
-                new_ct[well][ch] = _calc_ct(divided, baseline_settings.ct_threshold)
-                endpoint_rfi = float(divided[-1])
-                new_endpoint_rfi[well][ch] = endpoint_rfi
-                if endpoint_rfi >= baseline_settings.call_threshold:
-                    new_call[well][ch] = "Positive"
-                else:
-                    new_call[well][ch] = "Negative"
-
-    return BaselineResults(
-        subtracted=baseline_results.subtracted,
+    new_ct = baseline_results.ct.copy()
+    new_call = baseline_results.call.copy()
+    new_endpoint_rfi = baseline_results.endpoint_rfi.copy()
+    affected = {channel_idx[r.target_channel] for r in settings.rules
+                if r.target_channel in channel_set}
+    for t in affected:
+        divided = new_divided[:, t]
+        ok = valid[:, t]
+        new_ct[:, t] = _calc_ct_rows(divided, baseline_settings.ct_threshold)
+        endpoint_rfi = divided[:, -1]
+        new_endpoint_rfi[:, t] = endpoint_rfi
+        new_call[:, t] = np.where(
+            endpoint_rfi >= baseline_settings.call_threshold,
+            CALL_POSITIVE, CALL_NEGATIVE,
+        )
+        new_ct[~ok, t] = np.nan
+        new_endpoint_rfi[~ok, t] = np.nan
+        new_call[~ok, t] = CALL_NA
+
+    new_divided.flags.writeable = False
+    return replace(
+        baseline_results,
         divided=new_divided,
         ct=new_ct,
         call=new_call,
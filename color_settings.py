@@ -6,7 +6,7 @@ from PySide6.QtWidgets import (
     QScrollArea,
 )
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QColor, QPen
 
 
 # -- Default channel palette (tableau-10) ------------------------------------
@@ -35,24 +35,98 @@ class ColorSettings:
     def __init__(self):
         self.base_color: QColor = QColor(0, 0, 0, 255)
         self.channel_colors: list[QColor] = [QColor(c) for c in DEFAULT_CHANNEL_COLORS]
+        # Wells given the same colour share one QColor; replace, never mutate
         self.sample_colors: dict[str, QColor] = {}
         self.color_mode: str = "Base Color"  # or "Channel Colors"
+        # (well, channel_index, width) -> pen; wells resolving to the same
+        # colour share one QPen so callers can batch by pen identity.
+        self._rgba_cache: dict[tuple[str, int], tuple[int, int, int, int]] = {}
+        self._pen_cache: dict[tuple[str, int, float], QPen] = {}
+        self._pens_by_rgba: dict[tuple[int, int, int, int, float], QPen] = {}
+        self._resolved: dict[str, QColor] | None = None
 
-    def get_curve_color(self, well: str, channel_index: int) -> QColor:
-        """Resolve the colour for a given well / channel.
+    def get_curve_rgba(self, well: str,
+                       channel_index: int) -> tuple[int, int, int, int]:
+        """Resolve the (r, g, b, a) colour for a given well / channel.
 
         Priority: sample colour > channel colour (if mode) > base colour.
         """
-        if well in self.sample_colors:
-            return QColor(self.sample_colors[well])
-        if self.color_mode == "Channel Colors":
-            idx = min(channel_index, len(self.channel_colors) - 1)
-            return QColor(self.channel_colors[idx])
-        return QColor(self.base_color)
+        key = (well, channel_index)
+        rgba = self._rgba_cache.get(key)
+        if rgba is None:
+            if well in self.sample_colors:
+                c = self.sample_colors[well]
+            elif self.color_mode == "Channel Colors":
+                c = self.channel_colors[min(channel_index, len(self.channel_colors) - 1)]
+            else:
+                c = self.base_color
+            rgba = (c.red(), c.green(), c.blue(), c.alpha())
+            self._rgba_cache[key] = rgba
+        return rgba
+
+    def get_curve_pen(self, well: str, channel_index: int, width: float) -> QPen:
+        """Cached cosmetic pen for a well / channel at *width*."""
+        key = (well, channel_index, width)
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            rgba = self.get_curve_rgba(well, channel_index)
+            pen = self._pens_by_rgba.get((*rgba, width))
+            if pen is None:
+                pen = QPen(QColor(*rgba))
+                pen.setWidthF(width)
+                pen.setCosmetic(True)
+                self._pens_by_rgba[(*rgba, width)] = pen
+            self._pen_cache[key] = pen
+        return pen
+
+    def get_curve_pens(self, wells: list[str], channel_index: int,
+                       width: float) -> list[QPen]:
+        """Cached pens for *wells* of one channel, in order.
+
+        Only wells with a sample colour need their own lookup; the rest
+        share the channel's pen.
+        """
+        shared = self.get_curve_pen("", channel_index, width)
+        if not self.sample_colors:
+            return [shared] * len(wells)
+        return [
+            self.get_curve_pen(w, channel_index, width)
+            if w in self.sample_colors else shared
+            for w in wells
+        ]
+
+    def resolve_all(self, wells) -> dict[str, QColor]:
+        """Sample colours of *wells* that have one, as a shared read-only dict.
+
+        Built once per :meth:`invalidate`, so widgets can hold on to it
+        instead of copying ``sample_colors``.
+        """
+        if self._resolved is None:
+            self._resolved = {
+                w: self.sample_colors[w] for w in wells if w in self.sample_colors
+            }
+        return self._resolved
+
+    def fingerprint(self) -> tuple:
+        """Hashable snapshot of every colour choice, for change detection."""
+        return (
+            self.base_color.rgba(),
+            tuple(c.rgba() for c in self.channel_colors),
+            self.color_mode,
+            frozenset((w, c.rgba()) for w, c in self.sample_colors.items()),
+        )
+
+    def invalidate(self):
+        """Drop cached colours and pens; call after any colour or mode edit."""
+        self._resolved = None
+        self._rgba_cache.clear()
+        self._pen_cache.clear()
+        self._pens_by_rgba.clear()
 
     def reset_defaults(self):
         self.base_color = QColor(0, 0, 0, 255)
         self.channel_colors = [QColor(c) for c in DEFAULT_CHANNEL_COLORS]
+        self.invalidate()
 
 
 # -- Small reusable widgets --------------------------------------------------
@@ -121,17 +195,18 @@ class ColorEntryWidget(QWidget):
         self.pct_label = QLabel()
         self.pct_label.setFixedWidth(32)
         lay.addWidget(self.pct_label)
-        self._update_label()
+        self._update_label(self.slider.value())
 
         self.color_btn.colorChanged.connect(lambda _: self.changed.emit())
-        self.slider.valueChanged.connect(self._on_slider)
-
-    def _on_slider(self, _v: int):
-        self._update_label()
-        self.changed.emit()
+        # Without tracking, valueChanged (and so ``changed``) fires once on
+        # release; while dragging only the label follows via sliderMoved.
+        self.slider.setTracking(False)
+        self.slider.sliderMoved.connect(self._update_label)
+        self.slider.valueChanged.connect(self._update_label)
+        self.slider.valueChanged.connect(lambda _: self.changed.emit())
 
-    def _update_label(self):
-        self.pct_label.setText(f"{self.slider.value()}%")
+    def _update_label(self, value: int):
+        self.pct_label.setText(f"{value}%")
 
     def get_color(self) -> QColor:
         """Return the full RGBA colour."""
@@ -213,6 +288,7 @@ class ColorSettingsDialog(QDialog):
         settings.channel_colors = [
             ed.get_color() for ed in self._ch_editors
         ]
+        settings.invalidate()
 
 
 class SampleColorDialog(QDialog):
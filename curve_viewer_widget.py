@@ -3,10 +3,12 @@
 import pyqtgraph as pg
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
-    QCheckBox, QDoubleSpinBox,
+    QCheckBox, QDoubleSpinBox, QGraphicsItem,
 )
-from PySide6.QtGui import QStandardItemModel, QStandardItem
-from PySide6.QtCore import Qt, Signal, QEvent
+from PySide6.QtGui import (
+    QStandardItemModel, QStandardItem, QPen, QColor, QOpenGLContext,
+)
+from PySide6.QtCore import Qt, Signal, Slot, QEvent, QModelIndex, QTimer
 
 import numpy as np
 
@@ -19,6 +21,40 @@ pg.setConfigOptions(background='w', foreground='k', antialias=True)
 
 DEFAULT_CHANNEL = "465-510"
 
+# Above this many curves lines overlap too much for antialiasing to show
+DENSE_CURVE_COUNT = 50
+
+
+def _cosmetic_pen(color: QColor, width: float,
+                  style: Qt.PenStyle = Qt.PenStyle.SolidLine) -> QPen:
+    """Build a pixel-width QPen directly, skipping pg.mkPen's parsing."""
+    pen = QPen(color)
+    pen.setWidthF(width)
+    pen.setStyle(style)
+    pen.setCosmetic(True)
+    return pen
+
+
+def _peak_downsample(ys: np.ndarray, ds: int) -> np.ndarray:
+    """Reduce each row of *ys* to the min and max of every *ds* samples.
+
+    Same idea as pyqtgraph's ``'peak'`` mode: the outline survives while
+    the number of segments drops to about two per bin.  A trailing partial
+    bin is padded with its last sample, so those samples are kept too.
+    """
+    n_bins = -(-ys.shape[1] // ds)
+    pad = n_bins * ds - ys.shape[1]
+    if pad:
+        ys = np.pad(ys, ((0, 0), (0, pad)), mode='edge')
+    bins = ys.reshape(len(ys), n_bins, ds)
+    out = np.empty((len(ys), n_bins, 2), dtype=ys.dtype)
+    out[:, :, 0] = bins.min(axis=2)
+    out[:, :, 1] = bins.max(axis=2)
+    return out.reshape(len(ys), 2 * n_bins)
+
+
+_ZERO_LINE_PEN = _cosmetic_pen(QColor(0, 0, 0, 150), 1.0, Qt.PenStyle.DotLine)
+
 
 # ---------------------------------------------------------------------------
 # CheckableComboBox – multi-check dropdown that stays open on click
@@ -38,7 +74,8 @@ class CheckableComboBox(QComboBox):
         self.lineEdit().setReadOnly(True)
         self.lineEdit().setCursor(Qt.CursorShape.ArrowCursor)
         self.lineEdit().installEventFilter(self)
-        self.view().viewport().installEventFilter(self)
+        # Toggle on the view's click signal; Qt does the hit-testing
+        self.view().clicked.connect(self._on_item_clicked)
         self._item_model.itemChanged.connect(self._on_item_changed)
         self._updating = False
 
@@ -46,9 +83,9 @@ class CheckableComboBox(QComboBox):
 
     def add_checkable_item(self, text: str, checked: bool = True):
         item = QStandardItem(text)
-        item.setFlags(
-            Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
-        )
+        # Not user-checkable: the delegate would toggle the indicator on
+        # its own and _on_item_clicked would undo it
+        item.setFlags(Qt.ItemFlag.ItemIsEnabled)
         item.setCheckState(
             Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
         )
@@ -88,18 +125,6 @@ class CheckableComboBox(QComboBox):
     # -- internals ----------------------------------------------------------
 
     def eventFilter(self, obj, event):
-        # Prevent popup from closing when an item is clicked
-        if obj is self.view().viewport():
-            if event.type() == QEvent.Type.MouseButtonRelease:
-                idx = self.view().indexAt(event.pos())
-                if idx.isValid():
-                    it = self._item_model.itemFromIndex(idx)
-                    if it and (it.flags() & Qt.ItemFlag.ItemIsUserCheckable):
-                        new = (Qt.CheckState.Unchecked
-                               if it.checkState() == Qt.CheckState.Checked
-                               else Qt.CheckState.Checked)
-                        it.setCheckState(new)
-                return True
         # Clicking the line-edit should open the popup
         if obj is self.lineEdit():
             if event.type() == QEvent.Type.MouseButtonPress:
@@ -107,6 +132,17 @@ class CheckableComboBox(QComboBox):
                 return True
         return super().eventFilter(obj, event)
 
+    @Slot(QModelIndex)
+    def _on_item_clicked(self, idx):
+        # Items are not selectable, so the popup stays open on click
+        it = self._item_model.itemFromIndex(idx)
+        if it:
+            new = (Qt.CheckState.Unchecked
+                   if it.checkState() == Qt.CheckState.Checked
+                   else Qt.CheckState.Checked)
+            it.setCheckState(new)
+
+    @Slot(QStandardItem)
     def _on_item_changed(self, _item):
         if self._updating:
             return
@@ -141,12 +177,30 @@ class CurveViewerWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._data: LC480Data | None = None
-        self._selected_wells: set[str] = set()
-        self._inactive_wells: set[str] = set()
+        # Well membership as boolean masks over the data's well order
+        self._well_order: list[str] = []
+        self._selected_mask = np.zeros(0, dtype=bool)
+        self._inactive_mask = np.zeros(0, dtype=bool)
         self._line_width: float = 1.0
+        self._default_pen: QPen = _cosmetic_pen(QColor(0, 0, 0, 255), 1.0)
         self._log_y: bool = False
         self._color_settings: ColorSettings | None = None
         self._baseline_results: BaselineResults | None = None
+        # Items from the last draw, patched in place for cosmetic changes.
+        # Curves are a pool reused via setData across refreshes.
+        self._active_plots: list[pg.PlotItem] = []
+        self._active_curves: list[pg.PlotDataItem] = []
+        self._zero_line: pg.InfiniteLine | None = None
+        # Raw x of the last draw, the index span of it that was drawn and
+        # the downsampling factor applied
+        self._drawn_x = np.zeros(0)
+        self._clip = (0, 0)
+        self._ds = 1
+        # refresh() requests are coalesced into one redraw per event loop pass
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
 
         self._setup_ui()
         self._connect_signals()
@@ -212,17 +266,20 @@ class CurveViewerWidget(QWidget):
 
     def _connect_signals(self):
         self.channel_selector.checkedItemsChanged.connect(self._on_channels_changed)
-        self.display_combo.currentTextChanged.connect(lambda _: self.refresh())
+        self.display_combo.currentTextChanged.connect(self._on_display_changed)
         self.color_mode_combo.currentTextChanged.connect(self._on_color_mode_changed)
         self.log_y_check.toggled.connect(self._on_log_y_changed)
         self.line_width_spin.valueChanged.connect(self._on_line_width_changed)
-        self.smooth_check.toggled.connect(lambda _: self.refresh())
+        self.smooth_check.toggled.connect(self._on_smooth_changed)
 
     # -- Public API ----------------------------------------------------------
 
     def set_data(self, data: LC480Data):
         """Load new data and populate channel selector."""
         self._data = data
+        self._well_order = list(data.wells) if data else []
+        self._selected_mask = np.zeros(len(self._well_order), dtype=bool)
+        self._inactive_mask = np.zeros(len(self._well_order), dtype=bool)
         self.channel_selector.clear_items()
         if data and data.channels:
             default_found = False
@@ -237,17 +294,35 @@ class CurveViewerWidget(QWidget):
         self.refresh()
 
     def set_selected_wells(self, wells: set[str]):
-        self._selected_wells = set(wells)
+        self._selected_mask = self._mask_of(wells)
         self.refresh()
 
     def set_inactive_wells(self, wells: set[str]):
-        self._inactive_wells = set(wells)
+        self._inactive_mask = self._mask_of(wells)
         self.refresh()
 
-    def set_baseline_results(self, results: BaselineResults):
+    def _mask_of(self, wells: set[str]) -> np.ndarray:
+        mask = np.zeros(len(self._well_order), dtype=bool)
+        if self._data:
+            well_idx = self._data.well_idx
+            mask[[well_idx[w] for w in wells if w in well_idx]] = True
+        return mask
+
+    def set_baseline_results(self, results: BaselineResults | None):
         self._baseline_results = results
         self.refresh()
 
+    def set_use_opengl(self, enabled: bool) -> bool:
+        """Render the plots through an OpenGL viewport (or back to raster).
+
+        Returns whether OpenGL is in use afterwards; without a usable OpenGL
+        context the view stays on the raster backend.
+        """
+        if enabled and not QOpenGLContext().create():
+            enabled = False
+        self.graphics_layout.useOpenGL(enabled)
+        return enabled
+
     def set_color_settings(self, cs: ColorSettings):
         self._color_settings = cs
         self.color_mode_combo.blockSignals(True)
@@ -256,20 +331,31 @@ class CurveViewerWidget(QWidget):
         self.refresh()
 
     def refresh(self):
-        self.graphics_layout.clear()
-
-        if not self._data or not self._selected_wells:
+        """Schedule a redraw; repeated calls before it runs are merged."""
+        self._refresh_timer.start()
+
+    @Slot()
+    def _do_refresh(self):
+        self.graphics_layout.setUpdatesEnabled(False)
+        try:
+            self._redraw()
+        finally:
+            self.graphics_layout.setUpdatesEnabled(True)
+
+    def _redraw(self):
+        if not self._data or not self._selected_mask.any():
+            self._clear_plots()
             self.status_label.setText("")
             return
 
         checked = self.channel_selector.checked_items()
         if not checked:
+            self._clear_plots()
             self.status_label.setText("No channels selected")
             return
 
-        wells = sorted(
-            (self._selected_wells - self._inactive_wells) & set(self._data.wells)
-        )
+        shown = self._selected_mask & ~self._inactive_mask
+        wells = [self._well_order[i] for i in np.flatnonzero(shown)]
 
         if len(checked) == 1:
             self._draw_single(checked[0], wells)
@@ -286,7 +372,7 @@ class CurveViewerWidget(QWidget):
         mode = self.display_combo.currentText()
 
         if mode in ("First Derivative", "Second Derivative"):
-            raw = self._data.fluorescence.get(well, {}).get(channel)
+            raw = self._data.fluorescence_of(well, channel)
             if raw is None:
                 return None
             cycles = self._data.cycles
@@ -298,13 +384,13 @@ class CurveViewerWidget(QWidget):
             return np.diff(first_deriv) / np.diff(midpoints)
 
         if mode == "Raw Data":
-            return self._data.fluorescence.get(well, {}).get(channel)
+            return self._data.fluorescence_of(well, channel)
         if not self._baseline_results:
             return None
         if mode == "Baseline Subtracted":
-            return self._baseline_results.subtracted.get(well, {}).get(channel)
+            return self._baseline_results.subtracted_of(well, channel)
         if mode == "Baseline Divided":
-            return self._baseline_results.divided.get(well, {}).get(channel)
+            return self._baseline_results.divided_of(well, channel)
         return None
 
     def _get_x_data(self) -> np.ndarray:
@@ -340,73 +426,193 @@ class CurveViewerWidget(QWidget):
             return "Relative Fluorescence (RFI)"
         return "Fluorescence (RFU)"
 
-    def _pen_for(self, well: str, channel_index: int) -> pg.mkPen:
+    def _pens_for(self, wells: list[str], channel_index: int) -> list[QPen]:
         if self._color_settings:
-            c = self._color_settings.get_curve_color(well, channel_index)
-        else:
-            c = QColor(0, 0, 0, 255)
-        return pg.mkPen(
-            color=(c.red(), c.green(), c.blue(), c.alpha()),
-            width=self._line_width,
-        )
+            return self._color_settings.get_curve_pens(
+                wells, channel_index, self._line_width)
+        return [self._default_pen] * len(wells)
 
-    def _add_zero_line(self, plot):
-        """Add a dotted y=0 reference line for derivative modes."""
-        if self.display_combo.currentText() in ("First Derivative", "Second Derivative"):
-            zero_line = pg.InfiniteLine(
-                pos=0, angle=0,
-                pen=pg.mkPen(color=(0, 0, 0, 150), width=1, style=Qt.PenStyle.DotLine),
+    def _clear_plots(self):
+        self.graphics_layout.clear()
+        self._active_plots.clear()
+        self._active_curves.clear()
+        self._zero_line = None
+
+    def _add_plot(self, title: str) -> pg.PlotItem:
+        """Return the plot, configured for the current display settings.
+
+        The plot is created once and then re-titled and re-labelled in
+        place, so refreshes only update its curve items.
+        """
+        if self._active_plots:
+            plot = self._active_plots[0]
+            y_label = self._y_label()
+            if (plot.titleLabel.text != title
+                    or plot.getAxis('left').labelText != y_label):
+                # New channels or display mode: start from a fitted view
+                plot.setTitle(title)
+                plot.setLabel('left', y_label)
+                plot.enableAutoRange()
+        else:
+            plot = self.graphics_layout.addPlot(
+                title=title,
+                labels={'left': self._y_label(), 'bottom': 'Cycle'},
             )
-            plot.addItem(zero_line)
+            if self._log_y:
+                plot.setLogMode(y=True)
+            self._zero_line = pg.InfiniteLine(pos=0, angle=0, pen=_ZERO_LINE_PEN)
+            # Zooming or resizing changes how many samples share a pixel
+            plot.getViewBox().sigResized.connect(self._on_view_changed)
+            plot.getViewBox().sigXRangeChanged.connect(self._on_view_changed)
+            plot.addItem(self._zero_line)
+            self._active_plots.append(plot)
+        # Dotted y=0 reference line for derivative modes only
+        self._zero_line.setVisible(self.display_combo.currentText()
+                                   in ("First Derivative", "Second Derivative"))
+        return plot
+
+    def _plot_batched(self, plot: pg.PlotItem, x: np.ndarray,
+                      curves: list[tuple[QPen, np.ndarray]]):
+        """Plot (pen, y) curves as one NaN-separated item per pen.
+
+        NaN breaks the line (``connect='finite'``), so each group is a single
+        scene item instead of one item per curve.  Pens come from the
+        ColorSettings cache, which shares one object per colour.  Existing
+        items are refilled with setData and surplus ones hidden.
+        """
+        groups: dict[int, tuple[QPen, list[np.ndarray]]] = {}
+        for pen, y in curves:
+            groups.setdefault(id(pen), (pen, []))[1].append(y)
+        # pyqtgraph's own clip-to-view and downsampling assume monotonic x,
+        # which the NaN-joined arrays are not, so curves are clipped to the
+        # view and long ones reduced here.
+        self._drawn_x = x
+        lo, hi = self._clip = self._clip_span(x)
+        clipped = hi - lo < len(x)
+        ds = self._ds = self._downsample_factor(x)
+        x = x[lo:hi]
+        if ds > 1:
+            # Like pyqtgraph's 'peak' mode, each bin's min and max share
+            # the bin's first x, so peaks are drawn as vertical segments
+            x = np.repeat(x[::ds], 2)
+        x_sep = np.append(x, np.nan)
+        antialias = len(curves) <= DENSE_CURVE_COUNT
+        pool = self._active_curves
+        for i, (pen, ys) in enumerate(groups.values()):
+            if clipped:
+                ys = np.asarray(ys)[:, lo:hi]
+            if ds > 1:
+                ys = _peak_downsample(np.asarray(ys), ds)
+            xs = np.tile(x_sep, len(ys))
+            # One (curves, cycles + 1) block whose last column is the NaN break
+            block = np.empty((len(ys), len(x_sep)), dtype=np.float32)
+            block[:, :-1] = ys
+            block[:, -1] = np.nan
+            ys_sep = block.ravel()
+            if i < len(pool):
+                pool[i].setData(xs, ys_sep, pen=pen, connect='finite',
+                                antialias=antialias)
+                pool[i].setVisible(True)
+            else:
+                item = plot.plot(xs, ys_sep, pen=pen, connect='finite',
+                                 antialias=antialias)
+                # Rasterize once and blit on pan; setData/setPen call
+                # update(), which invalidates the cached pixmap.
+                item.curve.setCacheMode(
+                    QGraphicsItem.CacheMode.DeviceCoordinateCache)
+                pool.append(item)
+        for curve in pool[len(groups):]:
+            curve.setVisible(False)
+
+    def _clip_span(self, x: np.ndarray) -> tuple[int, int]:
+        """Index range of *x* to draw.
+
+        The view's x range widened by its own width on each side (plus one
+        sample, so lines run off the edge), so panning by less than a view
+        needs no redraw.  Everything is drawn while x auto-range is on.
+        """
+        vb = self._active_plots[0].getViewBox()
+        if vb.autoRangeEnabled()[0]:
+            return 0, len(x)
+        x0, x1 = vb.viewRange()[0]
+        w = x1 - x0
+        lo = int(np.searchsorted(x, x0 - w)) - 1
+        hi = int(np.searchsorted(x, x1 + w, side='right')) + 1
+        return max(lo, 0), min(hi, len(x))
+
+    def _downsample_factor(self, x: np.ndarray) -> int:
+        """Samples per horizontal pixel within the plot's x range.
+
+        With x auto-range on the view is (or is about to be) fitted to *x*,
+        so all of it counts; the view range may not have caught up yet.
+        """
+        vb = self._active_plots[0].getViewBox()
+        if vb.autoRangeEnabled()[0]:
+            n_visible = len(x)
+        else:
+            x0, x1 = vb.viewRange()[0]
+            n_visible = np.count_nonzero((x >= x0) & (x <= x1))
+        return max(n_visible // max(int(vb.width()), 1), 1)
+
+    @Slot()
+    def _on_view_changed(self):
+        if not (self._active_plots and self._active_curves):
+            return
+        x = self._drawn_x
+        lo, hi = self._clip
+        x0, x1 = self._active_plots[0].getViewBox().viewRange()[0]
+        # Redraw when the view leaves the drawn span or the density changes
+        if ((lo > 0 and x0 < x[lo]) or (hi < len(x) and x1 > x[hi - 1])
+                or self._downsample_factor(x) != self._ds):
+            self.refresh()
 
     def _draw_single(self, channel: str, wells: list[str]):
-        plot = self.graphics_layout.addPlot(
-            title=channel,
-            labels={'left': self._y_label(), 'bottom': 'Cycle'},
-        )
-        if self._log_y:
-            plot.setLogMode(y=True)
-        self._add_zero_line(plot)
-        x = self._get_x_data()
-        ch_idx = (self._data.channels.index(channel)
-                  if channel in self._data.channels else 0)
-        for well in wells:
-            y = self._get_y_data(well, channel)
-            if y is not None:
-                plot.plot(x, self._smooth(y), pen=self._pen_for(well, ch_idx))
-
-    def _draw_multi(self, channels: list[str], wells: list[str]):
-        title = ", ".join(channels)
-        plot = self.graphics_layout.addPlot(
-            title=title,
-            labels={'left': self._y_label(), 'bottom': 'Cycle'},
-        )
-        if self._log_y:
-            plot.setLogMode(y=True)
-        self._add_zero_line(plot)
-        x = self._get_x_data()
+        self._draw_multi([channel], wells, title=channel)
+
+    def _draw_multi(self, channels: list[str], wells: list[str],
+                    title: str | None = None):
+        plot = self._add_plot(title or ", ".join(channels))
+        curves = []
         for channel in channels:
-            ch_idx = (self._data.channels.index(channel)
-                      if channel in self._data.channels else 0)
-            for well in wells:
+            pens = self._pens_for(wells, self._data.channel_idx.get(channel, 0))
+            for well, pen in zip(wells, pens):
                 y = self._get_y_data(well, channel)
                 if y is not None:
-                    plot.plot(x, self._smooth(y), pen=self._pen_for(well, ch_idx))
+                    curves.append((pen, self._smooth(y)))
+        self._plot_batched(plot, self._get_x_data(), curves)
 
     # -- Slots ---------------------------------------------------------------
 
+    @Slot(list)
     def _on_channels_changed(self, _items: list[str]):
         self.refresh()
 
+    @Slot(str)
+    def _on_display_changed(self, _text: str):
+        self.refresh()
+
+    @Slot(bool)
+    def _on_smooth_changed(self, _checked: bool):
+        self.refresh()
+
+    @Slot(str)
     def _on_color_mode_changed(self, text: str):
         if self._color_settings:
             self._color_settings.color_mode = text
+            self._color_settings.invalidate()
         self.refresh()
 
+    @Slot(bool)
     def _on_log_y_changed(self, checked: bool):
         self._log_y = checked
-        self.refresh()
+        for plot in self._active_plots:
+            plot.setLogMode(y=checked)
 
+    @Slot(float)
     def _on_line_width_changed(self, value: float):
         self._line_width = value
-        self.refresh()
+        self._default_pen = _cosmetic_pen(QColor(0, 0, 0, 255), value)
+        for curve in self._active_curves:
+            pen = QPen(curve.opts['pen'])
+            pen.setWidthF(value)
+            curve.setPen(pen)
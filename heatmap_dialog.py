@@ -1,11 +1,12 @@
 """Heatmap dialog showing a color-coded plate map based on Ct/Call results."""
 
+import numpy as np
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QWidget, QCheckBox,
     QDoubleSpinBox, QFormLayout, QGroupBox,
 )
 from PySide6.QtCore import Qt, QRectF
-from PySide6.QtGui import QPainter, QColor, QPen, QFont, QLinearGradient
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QLinearGradient
 
 
 class HeatmapPlateWidget(QWidget):
@@ -24,6 +25,7 @@ class HeatmapPlateWidget(QWidget):
     COLOR_LOW_CT = QColor(244, 67, 54)          # red (lowest Ct = highest conc)
     COLOR_HIGH_CT = QColor(255, 235, 59)        # yellow (highest Ct = lowest conc)
     COLOR_NA = QColor(189, 189, 189)            # gray for N/A
+    GRADIENT_STEPS = 256
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -37,6 +39,15 @@ class HeatmapPlateWidget(QWidget):
         self._gradient_enabled: bool = True
         self._red_point: float | None = None   # user-defined low Ct (red end)
         self._yellow_point: float | None = None  # user-defined high Ct (yellow end)
+        self._ct_lut = self._build_ct_lut()
+        # Geometry cache, rebuilt lazily after a resize
+        self._geometry: tuple[float, float, float] | None = None
+        self._well_rects: list[list[QRectF]] = []
+        # well -> gradient color, rebuilt when the data or range changes
+        self._gradient_colors: dict[str, QColor] = {}
+        # Pens/brushes shared across wells and paints, keyed by fill rgba
+        self._pen_cache: dict[tuple[int, bool], QPen] = {}
+        self._brush_cache: dict[int, QBrush] = {}
         self.setMinimumSize(400, 300)
 
     def set_data(self, wells: list[str], sample_names: dict[str, str],
@@ -58,6 +69,7 @@ class HeatmapPlateWidget(QWidget):
             self._ct_min = None
             self._ct_max = None
 
+        self._update_gradient_colors()
         self.update()
 
     def set_gradient_enabled(self, enabled: bool):
@@ -67,6 +79,7 @@ class HeatmapPlateWidget(QWidget):
     def set_gradient_range(self, red_point: float | None, yellow_point: float | None):
         self._red_point = red_point
         self._yellow_point = yellow_point
+        self._update_gradient_colors()
         self.update()
 
     def set_inactive_wells(self, wells: set[str]):
@@ -95,19 +108,55 @@ class HeatmapPlateWidget(QWidget):
         offset_y = self.LABEL_MARGIN + self.PADDING + (avail_h - grid_h) / 2
         return cell_size, offset_x, offset_y
 
-    def _well_rect(self, row: int, col: int) -> QRectF:
-        cell_size, ox, oy = self._cell_geometry()
-        d = cell_size * 0.78
-        cx = ox + (col + 0.5) * cell_size
-        cy = oy + (row + 0.5) * cell_size
-        return QRectF(cx - d / 2, cy - d / 2, d, d)
-
     @staticmethod
     def _rc_to_well(row: int, col: int) -> str:
         return f"{chr(ord('A') + row)}{col + 1}"
 
+    def _cached_geometry(self) -> tuple[float, float, float]:
+        if self._geometry is None:
+            # Geometry is computed once here, not once per well
+            cell_size, ox, oy = self._geometry = self._cell_geometry()
+            d = cell_size * 0.78
+            self._well_rects = [
+                [QRectF(ox + (col + 0.5) * cell_size - d / 2,
+                        oy + (row + 0.5) * cell_size - d / 2, d, d)
+                 for col in range(self.COLS)]
+                for row in range(self.ROWS)
+            ]
+        return self._geometry
+
+    def resizeEvent(self, event):
+        self._geometry = None
+        super().resizeEvent(event)
+
     # -- Color logic ---------------------------------------------------------
 
+    @classmethod
+    def _build_ct_lut(cls) -> list[QColor]:
+        """Precompute the red -> yellow gradient as shared QColors."""
+        lo = np.array(cls.COLOR_LOW_CT.getRgb()[:3], dtype=np.float64)
+        hi = np.array(cls.COLOR_HIGH_CT.getRgb()[:3], dtype=np.float64)
+        t = np.linspace(0.0, 1.0, cls.GRADIENT_STEPS)[:, None]
+        rgb = (lo + t * (hi - lo)).astype(np.uint8)
+        return [QColor(int(r), int(g), int(b)) for r, g, b in rgb]
+
+    def _update_gradient_colors(self):
+        """Map every well with a Ct onto the gradient in one vectorized pass."""
+        self._gradient_colors = {}
+        lo = self.effective_red_point
+        hi = self.effective_yellow_point
+        if lo is None or hi is None or lo == hi:
+            return
+        wells = [w for w, ct in self._ct_data.items() if ct is not None]
+        if not wells:
+            return
+        cts = np.array([self._ct_data[w] for w in wells], dtype=np.float64)
+        # t=0 at red point (red), t=1 at yellow point (yellow)
+        t = np.clip((cts - lo) / (hi - lo), 0.0, 1.0)
+        idx = (t * (self.GRADIENT_STEPS - 1)).astype(np.intp)
+        lut = self._ct_lut
+        self._gradient_colors = {w: lut[i] for w, i in zip(wells, idx.tolist())}
+
     def _well_color(self, well: str) -> QColor:
         if well not in self._wells_with_data:
             return self.COLOR_NO_DATA
@@ -118,29 +167,15 @@ class HeatmapPlateWidget(QWidget):
         if call == "N/A":
             return self.COLOR_NA
         if call == "Negative":
-            return QColor(self.COLOR_NEGATIVE)
+            return self.COLOR_NEGATIVE
 
         # Positive well
         if not self._gradient_enabled:
-            return QColor(self.COLOR_POSITIVE)
-
-        # Gradient mode: red (low Ct) to yellow (high Ct)
-        ct = self._ct_data.get(well)
-        if ct is None:
-            return QColor(self.COLOR_LOW_CT)
+            return self.COLOR_POSITIVE
 
-        lo = self.effective_red_point
-        hi = self.effective_yellow_point
-        if lo is None or hi is None or lo == hi:
-            return QColor(self.COLOR_LOW_CT)
-
-        # t=0 at red point (red), t=1 at yellow point (yellow)
-        t = (ct - lo) / (hi - lo)
-        t = max(0.0, min(1.0, t))
-        r = int(self.COLOR_LOW_CT.red() + t * (self.COLOR_HIGH_CT.red() - self.COLOR_LOW_CT.red()))
-        g = int(self.COLOR_LOW_CT.green() + t * (self.COLOR_HIGH_CT.green() - self.COLOR_LOW_CT.green()))
-        b = int(self.COLOR_LOW_CT.blue() + t * (self.COLOR_HIGH_CT.blue() - self.COLOR_LOW_CT.blue()))
-        return QColor(r, g, b)
+        # Gradient mode: red (low Ct) to yellow (high Ct); wells without a
+        # Ct or with an empty range stay red
+        return self._gradient_colors.get(well, self.COLOR_LOW_CT)
 
     # -- Painting ------------------------------------------------------------
 
@@ -149,7 +184,7 @@ class HeatmapPlateWidget(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.fillRect(self.rect(), QColor(255, 255, 255))
 
-        cell_size, ox, oy = self._cell_geometry()
+        cell_size, ox, oy = self._cached_geometry()
         if cell_size <= 0:
             painter.end()
             return
@@ -175,11 +210,19 @@ class HeatmapPlateWidget(QWidget):
         for row in range(self.ROWS):
             for col in range(self.COLS):
                 well = self._rc_to_well(row, col)
-                rect = self._well_rect(row, col)
+                rect = self._well_rects[row][col]
                 fill = self._well_color(well)
-                border = fill.darker(120) if well in self._wells_with_data else QColor(180, 180, 180)
-                painter.setPen(QPen(border, 1.0))
-                painter.setBrush(fill)
+                has_data = well in self._wells_with_data
+                rgba = fill.rgba()
+                pen = self._pen_cache.get((rgba, has_data))
+                if pen is None:
+                    border = fill.darker(120) if has_data else QColor(180, 180, 180)
+                    pen = self._pen_cache[(rgba, has_data)] = QPen(border, 1.0)
+                brush = self._brush_cache.get(rgba)
+                if brush is None:
+                    brush = self._brush_cache[rgba] = QBrush(fill)
+                painter.setPen(pen)
+                painter.setBrush(brush)
                 painter.drawEllipse(rect)
 
         painter.end()
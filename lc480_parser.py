@@ -5,18 +5,51 @@ import numpy as np
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# Title line, e.g. "Experiment - MyRun (Run on LCS480 1.5.1.62)"
+_META_RE = re.compile(r'Experiment\s*-\s*(.+?)\s*\(Run on LCS480\s+(.+?)\)')
 
-@dataclass
+
+@dataclass(frozen=True)
 class LC480Data:
-    """Parsed LC480 export data."""
+    """Parsed LC480 export data.
+
+    Frozen, with a read-only ``fluo``, so one instance can be shared by the
+    UI and background baseline jobs without copying or locking.
+    """
     experiment_name: str = ""
     software_version: str = ""
     channels: list[str] = field(default_factory=list)
-    wells: list[str] = field(default_factory=list)
+    # Plate order; a tuple since it never changes after parsing
+    wells: tuple[str, ...] = ()
     sample_names: dict[str, str] = field(default_factory=dict)
-    num_cycles: int = 0
-    fluorescence: dict[str, dict[str, np.ndarray]] = field(default_factory=dict)
-    cycles: np.ndarray = field(default_factory=lambda: np.array([]))
+    # fluo[well_idx[w], channel_idx[c]] = raw curve, shape (W, C, T), float32
+    # (ample for detector readings); curves that were not measured are NaN
+    fluo: np.ndarray = field(default_factory=lambda: np.empty((0, 0, 0), dtype=np.float32))
+    # Derived from the fields above in __post_init__
+    num_cycles: int = field(init=False)
+    well_idx: dict[str, int] = field(init=False)
+    channel_idx: dict[str, int] = field(init=False)
+    cycles: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        self.fluo.flags.writeable = False
+        num_cycles = self.fluo.shape[2] if self.wells else 0
+        derived = {
+            "num_cycles": num_cycles,
+            "well_idx": {w: i for i, w in enumerate(self.wells)},
+            "channel_idx": {c: i for i, c in enumerate(self.channels)},
+            "cycles": np.arange(1, num_cycles + 1, dtype=np.int32),
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+
+    def fluorescence_of(self, well: str, channel: str) -> np.ndarray | None:
+        """Raw curve for *well* / *channel*, or None if it was not measured."""
+        w = self.well_idx.get(well)
+        c = self.channel_idx.get(channel)
+        if w is None or c is None or np.isnan(self.fluo[w, c]).all():
+            return None
+        return self.fluo[w, c]
 
 
 def well_sort_key(well: str) -> tuple[int, int]:
@@ -34,14 +67,13 @@ def parse_lc480_file(filepath: str | Path) -> LC480Data:
     """
     filepath = Path(filepath)
 
+    # Read once and split in C; fall back to latin-1 for legacy exports
+    raw = filepath.read_bytes()
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        text = raw.decode('utf-8')
     except UnicodeDecodeError:
-        with open(filepath, 'r', encoding='latin-1') as f:
-            lines = f.readlines()
-
-    data = LC480Data()
+        text = raw.decode('latin-1')
+    lines = text.splitlines()
 
     # Find the header line (starts with SamplePos)
     header_idx = None
@@ -54,57 +86,88 @@ def parse_lc480_file(filepath: str | Path) -> LC480Data:
         raise ValueError("Invalid LC480 file: could not find 'SamplePos' column header")
 
     # Parse metadata from lines before the header
+    experiment_name = software_version = ""
     for i in range(header_idx):
         line = lines[i].strip()
-        match = re.search(
-            r'Experiment\s*-\s*(.+?)\s*\(Run on LCS480\s+(.+?)\)', line
-        )
+        match = _META_RE.search(line)
         if match:
-            data.experiment_name = match.group(1).strip()
-            data.software_version = match.group(2).strip()
+            experiment_name = match.group(1).strip()
+            software_version = match.group(2).strip()
 
     # Parse column headers to identify fluorescence channels
     headers = lines[header_idx].strip().split('\t')
-    data.channels = [h.strip() for h in headers[7:] if h.strip()]
+    channels = [h.strip() for h in headers[7:] if h.strip()]
 
     # Parse data rows
-    raw: dict[str, dict[str, list[float]]] = {}
-
-    for line_num in range(header_idx + 1, len(lines)):
-        line = lines[line_num].strip()
-        if not line:
-            continue
-
-        parts = line.split('\t')
-        if len(parts) < 8:
-            continue
-
-        well = parts[0].strip()
-        sample_name = parts[1].strip()
-
-        if well not in raw:
-            raw[well] = {ch: [] for ch in data.channels}
-            data.sample_names[well] = sample_name
+    well_col, name_col, values = _read_rows(
+        lines[header_idx + 1:], len(channels)
+    )
+
+    # Group rows by well (stable, so each well keeps its cycle order)
+    uniq, first_row, inverse, counts = np.unique(
+        well_col, return_index=True, return_inverse=True, return_counts=True,
+    )
+    grouped = values[np.argsort(inverse, kind='stable')]
+    n_ch = len(channels)
+    n_cyc = int(counts.max()) if len(counts) else 0
+    if (counts == n_cyc).all():
+        fluo = grouped.reshape(len(uniq), n_cyc, n_ch).transpose(0, 2, 1)
+    else:
+        # Wells with fewer rows are padded with NaN
+        fluo = np.full((len(uniq), n_ch, n_cyc), np.nan, dtype=np.float32)
+        ends = np.cumsum(counts)
+        for k in range(len(uniq)):
+            fluo[k, :, :counts[k]] = grouped[ends[k] - counts[k]:ends[k]].T
+
+    rank = {}
+    sample_names = {}
+    for k, well in enumerate(uniq.tolist()):
+        rank[well] = k
+        sample_names[well] = str(name_col[first_row[k]])
 
-        for j, ch in enumerate(data.channels):
+    # Sort wells in plate order
+    wells = tuple(sorted(rank, key=well_sort_key))
+
+    return LC480Data(
+        experiment_name=experiment_name,
+        software_version=software_version,
+        channels=channels,
+        wells=wells,
+        sample_names=sample_names,
+        fluo=np.ascontiguousarray(fluo[[rank[w] for w in wells]]),
+    )
+
+
+def _read_rows(body: list[str],
+               n_ch: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Read the data rows below the header.
+
+    Returns ``(wells, sample_names, values)`` per row, with *values* of
+    shape ``(rows, n_ch)``. Well-formed files go through NumPy's C text
+    reader; otherwise rows are split in Python, skipping rows with fewer
+    than 8 columns and reading missing or unparsable cells as 0.0.
+    """
+    # loadtxt warns on input without data rows
+    body = [line for line in body if line.strip()]
+    if n_ch and body:
+        try:
+            values = np.loadtxt(body, delimiter='\t', usecols=range(7, 7 + n_ch),
+                                dtype=np.float32, comments=None, ndmin=2)
+            ids = np.loadtxt(body, delimiter='\t', usecols=(0, 1), dtype=str,
+                             comments=None, ndmin=2)
+            return np.char.strip(ids[:, 0]), np.char.strip(ids[:, 1]), values
+        except ValueError:
+            pass
+
+    rows = [parts for parts in (line.strip().split('\t') for line in body)
+            if len(parts) >= 8]
+    values = np.zeros((len(rows), n_ch), dtype=np.float32)
+    for i, parts in enumerate(rows):
+        for j in range(n_ch):
             try:
-                raw[well][ch].append(float(parts[7 + j]))
+                values[i, j] = float(parts[7 + j])
             except (IndexError, ValueError):
-                raw[well][ch].append(0.0)
-
-    # Sort wells in plate order
-    data.wells = sorted(raw.keys(), key=well_sort_key)
-
-    # Convert to numpy arrays
-    data.fluorescence = {}
-    for well in data.wells:
-        data.fluorescence[well] = {}
-        for ch in data.channels:
-            data.fluorescence[well][ch] = np.array(raw[well][ch])
-
-    if data.wells:
-        first_ch = data.channels[0]
-        data.num_cycles = len(data.fluorescence[data.wells[0]][first_ch])
-        data.cycles = np.arange(1, data.num_cycles + 1)
-
-    return data
+                pass
+    wells = np.array([parts[0].strip() for parts in rows], dtype=str)
+    names = np.array([parts[1].strip() for parts in rows], dtype=str)
+    return wells, names, values
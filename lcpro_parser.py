@@ -11,99 +11,153 @@ def parse_lcpro_file(filepath: str | Path) -> LC480Data:
     """Parse an LC Pro customer export XML file.
 
     Returns an LC480Data object for full compatibility with the existing UI.
+    The file is streamed with ``iterparse``. Sections are matched on the
+    same paths below the root as a tree lookup would use; each is read when
+    its element closes and then detached, as is every finished top-level
+    element, so the tree never holds more than one top-level element.
     """
     filepath = Path(filepath)
-    tree = ET.parse(filepath)
-    root = tree.getroot()
 
-    data = LC480Data()
-
-    # -- Metadata ------------------------------------------------------------
-    plate_setup = root.find("plate/plateSetup")
-    if plate_setup is not None:
-        name_el = plate_setup.find("name")
-        if name_el is not None and name_el.text:
-            data.experiment_name = name_el.text.strip()
-
-    instrument = root.find("instrument")
-    if instrument is not None:
-        ver_el = instrument.find("softwareVersion")
-        if ver_el is not None and ver_el.text:
-            data.software_version = f"LC Pro {ver_el.text.strip()}"
-
-    # -- Channel map (filterId -> dye name) ----------------------------------
+    experiment_name = software_version = ""
+    sample_names: dict[str, str] = {}
     channel_map: dict[int, str] = {}
-    for target in root.findall(
-        "runProfile/pcrProcess/pcrProfile/experimentDefinition/pcrTargets/pcrTarget"
-    ):
-        fid_el = target.find("filterId")
-        name_el = target.find("name")
-        if fid_el is not None and name_el is not None:
-            channel_map[int(fid_el.text)] = name_el.text.strip()
+    # segmentId -> small integer code, shared by all measurements
+    seg_codes: dict[str, int] = {}
+    # well -> (segment code, cycle, value) per acquisition
+    raw: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    have_plate_setup = have_instrument = False
+
+    # Open elements from the root down; elems[-1] is the one closing
+    elems: list[ET.Element] = []
+    for event, elem in ET.iterparse(filepath, events=("start", "end")):
+        if event == "start":
+            elems.append(elem)
+            continue
+
+        # Sections are recognised by their path below the root when they
+        # close, then detached from their parent
+        section = _SECTIONS.get(elem.tag)
+        matched = (section is not None and len(elems) == len(section) + 1
+                   and all(e.tag == t for e, t in zip(elems[1:], section)))
+        if matched:
+            tag = elem.tag
+            # -- Metadata ----------------------------------------------------
+            if tag == "plateSetup":
+                if not have_plate_setup:
+                    have_plate_setup = True
+                    name_el = elem.find("name")
+                    if name_el is not None and name_el.text:
+                        experiment_name = name_el.text.strip()
+
+            elif tag == "instrument":
+                if not have_instrument:
+                    have_instrument = True
+                    ver_el = elem.find("softwareVersion")
+                    if ver_el is not None and ver_el.text:
+                        software_version = f"LC Pro {ver_el.text.strip()}"
+
+            # -- Channel map (filterId -> dye name) --------------------------
+            elif tag == "pcrTarget":
+                fid_el = elem.find("filterId")
+                name_el = elem.find("name")
+                if fid_el is not None and name_el is not None:
+                    channel_map[int(fid_el.text)] = name_el.text.strip()
+
+            # -- Raw fluorescence from rundata/measurements ------------------
+            elif tag == "measurement":
+                pos_el = elem.find("positionName")
+                if pos_el is not None and pos_el.text:
+                    raw[pos_el.text.strip()] = _read_acquisitions(elem, seg_codes)
+
+            # -- Sample names from samples section ---------------------------
+            elif tag == "sample":
+                well_el = elem.find("wellPosition")
+                if well_el is not None and well_el.text:
+                    sample_names[well_el.text.strip()] = elem.get("id", "")
+
+        elems.pop()
+        # Finished sections and top-level children (recognised or not)
+        # are no longer needed
+        if elems and (matched or len(elems) == 1):
+            elems[-1].remove(elem)
 
     # Sort channels by filterId for consistent ordering
     sorted_filter_ids = sorted(channel_map.keys())
-    data.channels = [channel_map[fid] for fid in sorted_filter_ids]
+    channels = [channel_map[fid] for fid in sorted_filter_ids]
 
-    # Build segmentId -> channel name lookup
+    # Segment code -> channel index (-1 for segments that are not a channel)
     # segmentId pattern: channelNumber * 1000 + 32  (e.g. 22 -> 22032)
-    seg_to_channel: dict[str, str] = {}
-    for fid in sorted_filter_ids:
-        seg_id = str(fid * 1000 + 32)
-        seg_to_channel[seg_id] = channel_map[fid]
-
-    # -- Raw fluorescence from rundata/measurements --------------------------
-    raw: dict[str, dict[str, list[tuple[int, float]]]] = {}
-
-    for measurement in root.findall("rundata/measurements/measurement"):
-        pos_el = measurement.find("positionName")
-        if pos_el is None or not pos_el.text:
-            continue
-        well = pos_el.text.strip()
-        raw[well] = {ch: [] for ch in data.channels}
-
-        for curve_seg in measurement.findall("curveSegments/curveSegment"):
-            seg_id_el = curve_seg.find("segmentId")
-            if seg_id_el is None:
-                continue
-            seg_id = seg_id_el.text.strip()
-            channel_name = seg_to_channel.get(seg_id)
-            if channel_name is None:
-                continue
-
-            for acq in curve_seg.findall("acquisitions/acquisition"):
-                cycle_el = acq.find("cycle")
-                value_el = acq.find("measuredValue")
-                if cycle_el is not None and value_el is not None:
-                    cycle = int(cycle_el.text)
-                    value = float(value_el.text)
-                    raw[well][channel_name].append((cycle, value))
-
-    # -- Sample names from samples section -----------------------------------
-    for sample in root.findall("samples/sample"):
-        well_el = sample.find("wellPosition")
-        if well_el is None or not well_el.text:
+    seg_to_channel = {str(fid * 1000 + 32): c
+                      for c, fid in enumerate(sorted_filter_ids)}
+    code_to_channel = np.full(len(seg_codes), -1, dtype=np.intp)
+    for seg_id, code in seg_codes.items():
+        code_to_channel[code] = seg_to_channel.get(seg_id, -1)
+
+    # -- Sort wells and scatter into the (well, channel, cycle) array --------
+    wells = tuple(sorted(raw.keys(), key=well_sort_key))
+
+    parts = [raw[well] for well in wells]
+    codes = np.concatenate([p[0] for p in parts] or [np.empty(0, np.intp)])
+    cycles = np.concatenate([p[1] for p in parts] or [np.empty(0, np.intp)])
+    values = np.concatenate([p[2] for p in parts] or [np.empty(0, np.float32)])
+    well_of = np.repeat(np.arange(len(parts), dtype=np.intp),
+                        [len(p[0]) for p in parts])
+    channel_of = code_to_channel[codes]
+    keep = channel_of >= 0
+    # Curves are ordered by cycle number, whatever the numbering starts at;
+    # each distinct cycle becomes one column
+    cycle_nums, cycle_col = np.unique(cycles[keep], return_inverse=True)
+
+    # Cycles without an acquisition stay NaN (not measured)
+    fluo = np.full((len(wells), len(channels), len(cycle_nums)), np.nan,
+                   dtype=np.float32)
+    fluo[well_of[keep], channel_of[keep], cycle_col] = values[keep]
+
+    return LC480Data(
+        experiment_name=experiment_name,
+        software_version=software_version,
+        channels=channels,
+        wells=wells,
+        sample_names=sample_names,
+        fluo=fluo,
+    )
+
+
+# Sections read from the document, by tag, with their path below the root
+_SECTIONS: dict[str, tuple[str, ...]] = {
+    "plateSetup": ("plate", "plateSetup"),
+    "instrument": ("instrument",),
+    "pcrTarget": ("runProfile", "pcrProcess", "pcrProfile",
+                  "experimentDefinition", "pcrTargets", "pcrTarget"),
+    "measurement": ("rundata", "measurements", "measurement"),
+    "sample": ("samples", "sample"),
+}
+
+
+def _read_acquisitions(measurement: ET.Element, seg_codes: dict[str, int],
+                       ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Read a measurement as flat (segment code, cycle, value) arrays.
+
+    Segment ids are interned in *seg_codes* so that all measurements share
+    one integer code per segment.
+    """
+    codes: list[int] = []
+    cycles: list[int] = []
+    values: list[float] = []
+    for curve_seg in measurement.iterfind("curveSegments/curveSegment"):
+        seg_id = curve_seg.findtext("segmentId")
+        if seg_id is None:
             continue
-        well = well_el.text.strip()
-        sample_id = sample.get("id", "")
-        data.sample_names[well] = sample_id
-
-    # -- Sort wells and build numpy arrays -----------------------------------
-    data.wells = sorted(raw.keys(), key=well_sort_key)
-
-    data.fluorescence = {}
-    for well in data.wells:
-        data.fluorescence[well] = {}
-        for ch in data.channels:
-            # Sort by cycle number, extract values
-            points = sorted(raw[well][ch], key=lambda p: p[0])
-            data.fluorescence[well][ch] = np.array(
-                [v for _, v in points], dtype=float
-            )
-
-    if data.wells and data.channels:
-        first_ch = data.channels[0]
-        data.num_cycles = len(data.fluorescence[data.wells[0]][first_ch])
-        data.cycles = np.arange(1, data.num_cycles + 1)
-
-    return data
+        code = seg_codes.setdefault(seg_id.strip(), len(seg_codes))
+
+        for acq in curve_seg.iterfind("acquisitions/acquisition"):
+            cycle = acq.findtext("cycle")
+            value = acq.findtext("measuredValue")
+            if cycle is not None and value is not None:
+                codes.append(code)
+                cycles.append(int(cycle))
+                values.append(float(value))
+
+    return (np.array(codes, dtype=np.intp),
+            np.array(cycles, dtype=np.intp),
+            np.array(values, dtype=np.float32))
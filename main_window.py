@@ -1,19 +1,28 @@
 """Main application window."""
 
+import copy
+from dataclasses import replace
+from functools import partial
+from pathlib import Path
+
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QSplitter,
     QFileDialog, QMessageBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QColor
 
 from lc480_parser import LC480Data, parse_lc480_file
 from lcpro_parser import parse_lcpro_file
+from parse_cache import parse_cached
 from plate_map_widget import PlateMapWidget
 from sample_table_widget import SampleTableWidget
 from curve_viewer_widget import CurveViewerWidget
 from color_settings import ColorSettings, ColorSettingsDialog, SampleColorDialog
-from baseline import BaselineSettings, BaselineResults, compute_baseline, BaselineSettingsDialog
+from baseline import (
+    BaselineSettings, BaselineResults, compute_baseline_incremental,
+    BaselineSettingsDialog,
+)
 from color_compensation import (
     ColorCompensationSettings, ColorCompensationDialog, apply_color_compensation,
 )
@@ -22,6 +31,38 @@ from LLM.settings_dialog import LLMSettingsDialog
 from LLM.env_store import load_api_key, save_api_key, clear_api_key
 
 
+# ---------------------------------------------------------------------------
+# Background jobs (file parsing, baseline computation)
+# ---------------------------------------------------------------------------
+
+class _JobSignals(QObject):
+    # (generation, result, error); error is None unless compute raised
+    finished = Signal(int, object, object)
+
+
+class _BackgroundJob(QRunnable):
+    """Runs *compute* on the global thread pool.
+
+    The result (or the exception raised) is sent through *signals*, which
+    the window owns and which deliver to the GUI thread through a queued
+    connection.  The pool deletes the job once it has run.
+    """
+
+    def __init__(self, generation: int, compute, signals: _JobSignals):
+        super().__init__()
+        self._generation = generation
+        self._compute = compute
+        self._signals = signals
+
+    def run(self):
+        result = error = None
+        try:
+            result = self._compute()
+        except Exception as exc:
+            error = exc
+        self._signals.finished.emit(self._generation, result, error)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -29,11 +70,47 @@ class MainWindow(QMainWindow):
         self.resize(1200, 800)
 
         self._data: LC480Data | None = None
-        self._syncing = False
+        # Selection changes from the plate map / table, fanned out once per
+        # event loop pass by _flush_selection_sync
+        self._pending_selection: set[str] | None = None
+        # Shared read-only set of all loaded wells, and the selection size
+        # shown in the status bar (kept here instead of asking the plate map)
+        self._all_wells: frozenset[str] = frozenset()
+        self._selection_size = 0
+        self._status_parts: tuple[str, str] = ("", "")
+        # Per-well sample colours of the loaded wells, rebuilt by _push_colors
+        self._resolved_colors: dict[str, QColor] = {}
+        # Channel toggles refresh the table's Ct/Call columns once per event
+        # loop pass; _table_source is what the table currently shows and
+        # _current_channel the first checked channel
+        self._ct_refresh_timer = QTimer(self)
+        self._ct_refresh_timer.setSingleShot(True)
+        self._ct_refresh_timer.setInterval(0)
+        self._ct_refresh_timer.timeout.connect(self._update_table_ct_call)
+        self._table_source: tuple[BaselineResults | None, str | None] = (None, None)
+        self._current_channel: str | None = None
+        self._pending_source: QWidget | None = None
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(0)
+        self._sync_timer.timeout.connect(self._flush_selection_sync)
         self._color_settings = ColorSettings()
         self._baseline_settings = BaselineSettings()
         self._baseline_results: BaselineResults | None = None
+        # Baseline results before color compensation, reused on recompute
+        self._uncompensated_results: BaselineResults | None = None
         self._color_comp_settings = ColorCompensationSettings()
+        # Background baseline jobs; results from older generations are dropped
+        self._baseline_signals = _JobSignals(self)
+        self._baseline_signals.finished.connect(self._on_baseline_finished)
+        self._baseline_gen = 0
+        self._baseline_pending = False
+        # Callbacks waiting for the newest baseline results to be applied
+        self._baseline_waiters: list = []
+        # File imports, same generation scheme as the baseline jobs
+        self._parse_signals = _JobSignals(self)
+        self._parse_signals.finished.connect(self._on_parse_finished)
+        self._parse_gen = 0
         self._inactive_wells: set[str] = set()
 
         # LLM state (api key optionally persisted via .env)
@@ -102,6 +179,10 @@ class MainWindow(QMainWindow):
         view_menu = self.menuBar().addMenu("&View")
         heatmap_act = view_menu.addAction("&Heatmap")
         heatmap_act.triggered.connect(self._open_heatmap)
+        view_menu.addSeparator()
+        self._opengl_act = view_menu.addAction("Use &OpenGL Rendering")
+        self._opengl_act.setCheckable(True)
+        self._opengl_act.toggled.connect(self._on_opengl_toggled)
 
         # LLM menu
         llm_menu = self.menuBar().addMenu("&LLM")
@@ -111,44 +192,63 @@ class MainWindow(QMainWindow):
         llm_console_act.triggered.connect(self._open_llm_console)
 
     def _connect_signals(self):
-        self.plate_map.selectionChanged.connect(self._on_plate_selection)
+        # Queued: a view's selection change is handled after its own event
+        # returns, never re-entrantly from inside another view's update
+        self.plate_map.selectionChanged.connect(
+            self._on_plate_selection, Qt.ConnectionType.QueuedConnection
+        )
         self.plate_map.configureColorRequested.connect(self._on_configure_color)
         self.plate_map.clearColorRequested.connect(self._on_clear_color)
         self.plate_map.inactivateRequested.connect(self._on_inactivate_wells)
         self.plate_map.reactivateRequested.connect(self._on_reactivate_wells)
-        self.sample_table.selectionChanged.connect(self._on_table_selection)
+        self.sample_table.selectionChanged.connect(
+            self._on_table_selection, Qt.ConnectionType.QueuedConnection
+        )
         self.curve_viewer.channel_selector.checkedItemsChanged.connect(
-            lambda _: self._update_table_ct_call()
+            self._on_channels_changed
         )
 
     # -- File import ---------------------------------------------------------
 
     def _import_file(self):
-        filepath, _ = QFileDialog.getOpenFileName(
-            self, "Import LC480 File", "",
-            "Text Files (*.txt);;All Files (*)",
+        self._open_import_dialog(
+            "Import LC480 File", "Text Files (*.txt);;All Files (*)",
+            parse_lc480_file,
         )
-        if not filepath:
-            return
-        try:
-            self._data = parse_lc480_file(filepath)
-        except Exception as exc:
-            QMessageBox.critical(self, "Import Error", str(exc))
-            return
-        self._on_data_loaded()
 
     def _import_lcpro_file(self):
-        filepath, _ = QFileDialog.getOpenFileName(
-            self, "Import LC-Pro File", "",
-            "XML Files (*.xml);;All Files (*)",
+        self._open_import_dialog(
+            "Import LC-Pro File", "XML Files (*.xml);;All Files (*)",
+            parse_lcpro_file,
         )
+
+    def _open_import_dialog(self, title: str, name_filter: str, parser):
+        # Window-modal open() instead of a nested exec() event loop
+        dlg = QFileDialog(self, title, "", name_filter)
+        dlg.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dlg.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dlg.fileSelected.connect(partial(self._start_parse, parser=parser))
+        dlg.open()
+
+    def _start_parse(self, filepath: str, parser):
+        """Parse *filepath* on the thread pool; see :meth:`_on_parse_finished`."""
         if not filepath:
             return
-        try:
-            self._data = parse_lcpro_file(filepath)
-        except Exception as exc:
-            QMessageBox.critical(self, "Import Error", str(exc))
+        self._parse_gen += 1
+        job = _BackgroundJob(self._parse_gen,
+                             partial(parse_cached, filepath, parser),
+                             self._parse_signals)
+        self.statusBar().showMessage(f"Loading {Path(filepath).name}\u2026")
+        QThreadPool.globalInstance().start(job)
+
+    def _on_parse_finished(self, generation: int, data, error):
+        if generation != self._parse_gen:
+            return  # superseded by a newer import
+        if error is not None:
+            QMessageBox.critical(self, "Import Error", str(error))
+            self._update_status()
             return
+        self._data = data
         self._on_data_loaded()
 
     def _on_data_loaded(self):
@@ -156,21 +256,43 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(f"LC480 Result Viewer - {d.experiment_name}")
 
         self._inactive_wells = set()
-        self.plate_map.set_data(d.wells, d.sample_names)
-        self.sample_table.set_data(d)
-        self.curve_viewer.set_data(d)
-
-        all_wells = set(d.wells)
-        self._syncing = True
-        self.plate_map.set_selection(all_wells)
-        self.sample_table.set_selection(all_wells)
-        self.curve_viewer.set_selected_wells(all_wells)
-        self._syncing = False
-
-        self._push_colors()
-        self._push_inactive()
-        self._recompute_baseline()
+        self._uncompensated_results = None
+        self._baseline_results = None
+        self._all_wells = frozenset(d.wells)
+        # Status text around the selection count; only the count changes
+        # between updates. Kept as two parts since the experiment name may
+        # contain format characters.
+        self._status_parts = (
+            f"{d.experiment_name}  |  ",
+            f"/{len(d.wells)} wells selected  |  "
+            f"{d.num_cycles} cycles  |  {len(d.channels)} channels",
+        )
+
+        # Populate the views in bulk: one repaint at the end, and no
+        # selection signals echoing back while they are filled
+        views = (self.plate_map, self.sample_table, self.curve_viewer)
+        self.setUpdatesEnabled(False)
+        for view in views:
+            view.blockSignals(True)
+        try:
+            self.curve_viewer.set_baseline_results(None)
+            self.plate_map.set_data(d.wells, d.sample_names)
+            self.sample_table.set_data(d)
+            self._table_source = (None, None)
+            self.curve_viewer.set_data(d)
+            checked = self.curve_viewer.channel_selector.checked_items()
+            self._current_channel = checked[0] if checked else None
+            self._apply_selection(self._all_wells)
+            self._push_colors()
+            self._push_inactive()
+        finally:
+            for view in views:
+                view.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.update()
+
         self._update_status()
+        self._recompute_baseline()
 
     # -- File export ---------------------------------------------------------
 
@@ -189,17 +311,19 @@ class MainWindow(QMainWindow):
         import csv
 
         # Read current table contents (mirrors what the user sees)
-        table = self.sample_table.table
-        headers = []
-        for col in range(table.columnCount()):
-            headers.append(table.horizontalHeaderItem(col).text())
+        model = self.sample_table.model
+        n_cols = model.columnCount()
+        headers = [
+            model.headerData(col, Qt.Orientation.Horizontal)
+            for col in range(n_cols)
+        ]
 
         rows = []
-        for row in range(table.rowCount()):
+        for row in range(model.rowCount()):
             row_data = []
-            for col in range(table.columnCount()):
-                item = table.item(row, col)
-                row_data.append(item.text() if item else "")
+            for col in range(n_cols):
+                text = model.data(model.index(row, col))
+                row_data.append(text or "")
             rows.append(row_data)
 
         try:
@@ -215,36 +339,61 @@ class MainWindow(QMainWindow):
 
     # -- Selection sync ------------------------------------------------------
 
-    def _on_plate_selection(self, wells: set[str]):
-        if self._syncing:
-            return
-        self._syncing = True
-        self.sample_table.set_selection(wells)
-        self.curve_viewer.set_selected_wells(wells)
-        self._syncing = False
-        self._update_status()
+    def _on_plate_selection(self, wells: frozenset[str]):
+        self._queue_selection(wells, self.plate_map)
 
     def _on_table_selection(self, wells: set[str]):
-        if self._syncing:
+        self._queue_selection(wells, self.sample_table)
+
+    def _queue_selection(self, wells: set[str], source: QWidget):
+        # Later changes replace earlier ones until the timer fires
+        self._pending_selection = wells
+        self._pending_source = source
+        self._sync_timer.start()
+
+    def _flush_selection_sync(self):
+        if self._pending_selection is None:
             return
-        self._syncing = True
-        self.plate_map.set_selection(wells)
-        self.curve_viewer.set_selected_wells(wells)
-        self._syncing = False
+        wells, source = self._pending_selection, self._pending_source
+        self._apply_selection(wells, source)
         self._update_status()
 
+    def _apply_selection(self, wells: set[str], source: QWidget | None = None):
+        """Show *wells* as selected in every view except *source*.
+
+        Drops any queued selection change, which *wells* supersedes. The
+        views only read *wells*, so the same set object is shared by all.
+        """
+        self._selection_size = len(wells)
+        self._sync_timer.stop()
+        self._pending_selection = None
+        self._pending_source = None
+        if source is not self.plate_map:
+            self.plate_map.set_selection(wells)
+        if source is not self.sample_table:
+            self.sample_table.set_selection(wells)
+        self.curve_viewer.set_selected_wells(wells)
+
     # -- Colour management ---------------------------------------------------
 
     def _push_colors(self):
         """Push current colour settings to all widgets that need them."""
-        self.plate_map.set_sample_colors(self._color_settings.sample_colors)
+        self._color_settings.invalidate()
+        wells = self._data.wells if self._data else ()
+        self._resolved_colors = self._color_settings.resolve_all(wells)
+        self.plate_map.set_sample_colors(self._resolved_colors)
+        # Curve pens depend on the channel as well; the viewer resolves them
+        # through the settings' own per-(well, channel) cache
         self.curve_viewer.set_color_settings(self._color_settings)
 
     def _open_color_settings(self):
         dlg = ColorSettingsDialog(self._color_settings, parent=self)
         if dlg.exec() == dlg.DialogCode.Accepted:
+            before = self._color_settings.fingerprint()
             dlg.apply_to(self._color_settings)
-            self._push_colors()
+            # OK without edits: widgets already show these colours
+            if self._color_settings.fingerprint() != before:
+                self._push_colors()
 
     def _on_configure_color(self, wells: set[str]):
         # Use existing colour of first well as initial, if any
@@ -252,9 +401,9 @@ class MainWindow(QMainWindow):
         initial = self._color_settings.sample_colors.get(first)
         dlg = SampleColorDialog(len(wells), initial=initial, parent=self)
         if dlg.exec() == dlg.DialogCode.Accepted:
-            c = dlg.get_color()
-            for w in wells:
-                self._color_settings.sample_colors[w] = QColor(c)
+            # One QColor shared by all the wells (colours are never mutated)
+            color = QColor(dlg.get_color())
+            self._color_settings.sample_colors.update(dict.fromkeys(wells, color))
             self._push_colors()
 
     def _on_clear_color(self, wells: set[str]):
@@ -290,8 +439,10 @@ class MainWindow(QMainWindow):
             self._baseline_settings, num_cycles=num_cycles, parent=self
         )
         if dlg.exec() == dlg.DialogCode.Accepted:
+            before = replace(self._baseline_settings)
             dlg.apply_to(self._baseline_settings)
-            self._recompute_baseline()
+            if self._baseline_settings != before:
+                self._recompute_baseline()
 
     def _open_color_compensation(self):
         channels = self._data.channels if self._data else []
@@ -299,48 +450,94 @@ class MainWindow(QMainWindow):
             self._color_comp_settings, channels=channels, parent=self
         )
         if dlg.exec() == dlg.DialogCode.Accepted:
+            before = copy.deepcopy(self._color_comp_settings)
             dlg.apply_to(self._color_comp_settings)
-            self._recompute_baseline()
+            if self._color_comp_settings != before:
+                self._recompute_baseline()
 
     def _recompute_baseline(self):
-        """Recompute baseline results and push to all widgets."""
+        """Recompute baseline results in the background.
+
+        The widgets are updated by :meth:`_on_baseline_finished`; a newer
+        request supersedes any computation still running.
+        """
         if not self._data:
             return
-        self._baseline_results = compute_baseline(
-            self._data, self._baseline_settings
-        )
-        # Apply color compensation (modifies divided data + recalculates Ct/Call)
-        self._baseline_results = apply_color_compensation(
-            self._baseline_results, self._color_comp_settings,
-            self._baseline_settings, self._data.wells, self._data.channels,
-        )
-        self.curve_viewer.set_baseline_results(self._baseline_results)
-        self._update_table_ct_call()
-
-    def _update_table_ct_call(self):
-        """Update sample table Ct/Call/RFI columns for the first checked channel."""
-        if not self._baseline_results or not self._data:
-            self.sample_table.set_ct_call({}, {})
+        # Snapshot inputs so later edits cannot race the worker
+        data = self._data
+        previous = self._uncompensated_results
+        settings = replace(self._baseline_settings)
+        comp_settings = copy.deepcopy(self._color_comp_settings)
+
+        def compute():
+            # Only Ct/Call are redone when just the thresholds changed
+            uncompensated = compute_baseline_incremental(previous, data, settings)
+            # Apply color compensation (modifies divided data + recalculates Ct/Call)
+            compensated = apply_color_compensation(
+                uncompensated, comp_settings, settings, data.wells, data.channels,
+            )
+            return uncompensated, compensated
+
+        self._baseline_gen += 1
+        self._baseline_pending = True
+        job = _BackgroundJob(self._baseline_gen, compute, self._baseline_signals)
+        self.statusBar().showMessage("Computing baseline\u2026")
+        QThreadPool.globalInstance().start(job)
+
+    def _on_baseline_finished(self, generation: int, results, error):
+        if generation != self._baseline_gen:
+            return  # superseded by a newer request
+        self._baseline_pending = False
+        if error is not None:
+            QMessageBox.critical(self, "Baseline Error", str(error))
+            self._update_status()
+        else:
+            self._uncompensated_results, self._baseline_results = results
+            self.curve_viewer.set_baseline_results(self._baseline_results)
+            self._update_table_ct_call()
+            self._update_status()
+        waiters, self._baseline_waiters = self._baseline_waiters, []
+        for callback in waiters:
+            callback()
+
+    def when_baseline_ready(self, callback):
+        """Call *callback* once no baseline computation is pending.
+
+        Runs it right away when the results are current, otherwise after
+        :meth:`_on_baseline_finished` has applied the newest job.
+        """
+        if self._baseline_pending:
+            self._baseline_waiters.append(callback)
+        else:
+            callback()
+
+    def _on_channels_changed(self, items: list[str]):
+        channel = items[0] if items else None
+        if channel == self._current_channel:
             return
+        self._current_channel = channel
+        self._ct_refresh_timer.start()
 
-        checked = self.curve_viewer.channel_selector.checked_items()
-        if not checked:
-            self.sample_table.set_ct_call({}, {})
+    def _update_table_ct_call(self):
+        """Point the sample table's Ct/Call/RFI columns at the first checked channel."""
+        channel = self._current_channel if self._data else None
+        source = (self._baseline_results, channel)
+        if (source[0] is self._table_source[0]
+                and source[1] == self._table_source[1]):
             return
-
-        first_channel = checked[0]
-        ct_data: dict[str, float | None] = {}
-        call_data: dict[str, str] = {}
-        rfi_data: dict[str, float | None] = {}
-        for well in self._data.wells:
-            ct_data[well] = self._baseline_results.ct.get(well, {}).get(first_channel)
-            call_data[well] = self._baseline_results.call.get(well, {}).get(first_channel, "N/A")
-            rfi_data[well] = self._baseline_results.endpoint_rfi.get(well, {}).get(first_channel)
-
-        self.sample_table.set_ct_call(ct_data, call_data, rfi_data)
+        self._table_source = source
+        self.sample_table.set_baseline(*source)
 
     # -- View dialogs --------------------------------------------------------
 
+    def _on_opengl_toggled(self, checked: bool):
+        # Off by default: some drivers render QOpenGLWidget viewports badly
+        if self.curve_viewer.set_use_opengl(checked) != checked:
+            self._opengl_act.blockSignals(True)
+            self._opengl_act.setChecked(False)
+            self._opengl_act.blockSignals(False)
+            QMessageBox.warning(self, "OpenGL", "OpenGL rendering is not available.")
+
     def _open_heatmap(self):
         if not self._data or not self._baseline_results:
             QMessageBox.information(self, "Heatmap", "No data loaded.")
@@ -352,14 +549,11 @@ class MainWindow(QMainWindow):
             return
 
         first_channel = checked[0]
-        ct_data: dict[str, float | None] = {}
-        call_data: dict[str, str] = {}
-        for well in self._data.wells:
-            ct_data[well] = self._baseline_results.ct.get(well, {}).get(first_channel)
-            call_data[well] = self._baseline_results.call.get(well, {}).get(first_channel, "N/A")
+        d = self._data
+        ct_data, call_data = self._baseline_results.ct_call_by_well(first_channel)
 
         dlg = HeatmapDialog(
-            self._data.wells, self._data.sample_names,
+            d.wells, d.sample_names,
             call_data, ct_data, channel=first_channel,
             inactive_wells=self._inactive_wells, parent=self,
         )
@@ -412,11 +606,9 @@ class MainWindow(QMainWindow):
     def _update_status(self):
         if not self._data:
             return
-        sel = len(self.plate_map.get_selection())
-        total = len(self._data.wells)
-        self.statusBar().showMessage(
-            f"{self._data.experiment_name}  |  "
-            f"{sel}/{total} wells selected  |  "
-            f"{self._data.num_cycles} cycles  |  "
-            f"{len(self._data.channels)} channels"
-        )
+        prefix, suffix = self._status_parts
+        message = f"{prefix}{self._selection_size}{suffix}"
+        # Selection events often leave the count unchanged; skip the repaint
+        bar = self.statusBar()
+        if bar.currentMessage() != message:
+            bar.showMessage(message)
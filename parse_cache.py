@@ -0,0 +1,89 @@
+"""On-disk cache of parsed export files, keyed on path, mtime and size."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+from lc480_parser import LC480Data
+
+CACHE_DIR = Path.home() / ".cache" / "lc480_viewer"
+# Bump when LC480Data or a parser changes so stale entries are ignored
+CACHE_VERSION = 4
+# Oldest entries beyond this many are deleted after each write
+MAX_ENTRIES = 32
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def parse_cached(filepath: str | Path,
+                 parser: Callable[[str | Path], LC480Data]) -> LC480Data:
+    """Return ``parser(filepath)``, reusing a cached result if the file is unchanged.
+
+    The cache lives in the user's own cache directory. Entries are named
+    ``<source>-<state>.pkl``: a new version of a file replaces its older
+    entries, and at most :data:`MAX_ENTRIES` are kept overall. Unreadable
+    or stale entries fall back to parsing, and failing to write the cache
+    is ignored.
+    """
+    filepath = Path(filepath).resolve()
+    st = filepath.stat()
+    source = _digest(f"{parser.__module__}.{parser.__qualname__}|{filepath}")
+    state = _digest(f"{CACHE_VERSION}|{st.st_mtime_ns}|{st.st_size}")
+    cache_path = CACHE_DIR / f"{source}-{state}.pkl"
+
+    if cache_path.exists():
+        try:
+            data = pickle.loads(cache_path.read_bytes())
+            if isinstance(data, LC480Data):
+                return data
+        except Exception:
+            pass  # corrupt or incompatible entry: parse again
+
+    data = parser(filepath)
+    _store(cache_path, data)
+    _prune(cache_path, source)
+    return data
+
+
+def _store(cache_path: Path, data: LC480Data):
+    """Write *data* to *cache_path* atomically; errors are ignored."""
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per write, so concurrent parses of the same
+        # file never share one; renamed into place only when complete
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_path)
+    # pickle reports unpicklable objects as PicklingError, TypeError or
+    # AttributeError depending on the object
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def _prune(keep: Path, source: str):
+    """Drop other entries of *source* and the oldest beyond MAX_ENTRIES."""
+    try:
+        entries = []
+        for path in CACHE_DIR.glob("*.pkl"):
+            if path == keep:
+                continue
+            if path.name.startswith(f"{source}-"):
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((path.stat().st_mtime, path))
+        entries.sort(reverse=True)
+        for _, path in entries[MAX_ENTRIES - 1:]:
+            path.unlink(missing_ok=True)
+    except OSError:
+        pass
@@ -1,14 +1,17 @@
 """Interactive 96-well plate map widget."""
 
+import math
+
+import numpy as np
 from PySide6.QtWidgets import QWidget, QMenu, QToolTip
 from PySide6.QtCore import Qt, Signal, QRectF, QPointF
-from PySide6.QtGui import QPainter, QColor, QPen, QFont
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont
 
 
 class PlateMapWidget(QWidget):
     """Custom-painted 96-well plate map with interactive selection."""
 
-    selectionChanged = Signal(set)
+    selectionChanged = Signal(frozenset)    # read-only snapshot
     configureColorRequested = Signal(set)   # wells to assign colour
     clearColorRequested = Signal(set)       # wells to clear colour from
     inactivateRequested = Signal(set)       # wells to mark inactive
@@ -18,23 +21,57 @@ class PlateMapWidget(QWidget):
     COLS = 12
     ROW_LABELS = [chr(ord('A') + i) for i in range(8)]
     COL_LABELS = [str(i + 1) for i in range(12)]
+    # WELL_NAMES[row][col] -> "A1" ... "H12"
+    WELL_NAMES = [[f"{r}{c + 1}" for c in range(12)] for r in ROW_LABELS]
+    _WELL_RC = {w: (r, c) for r, names in enumerate(WELL_NAMES)
+                for c, w in enumerate(names)}
+    # Row-major flat index (row * COLS + col) -> well name
+    WELL_NAMES_FLAT = [w for names in WELL_NAMES for w in names]
     LABEL_MARGIN = 24
     PADDING = 4
 
+    COLOR_BACKGROUND = QColor(255, 255, 255)
+    COLOR_LABEL = QColor(0, 0, 0)
+    CROSS_PEN = QPen(QColor(180, 0, 0, 160), 1.5)      # inactive well marker
+    BAND_PEN = QPen(QColor(0, 0, 0), 1, Qt.PenStyle.DashLine)
+    BAND_BRUSH = QBrush(QColor(0, 0, 0, 30))
+    # Widest well border (2.5 px) overhangs a well rect by half its width,
+    # plus a pixel of antialiasing
+    WELL_PAINT_MARGIN = 3
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._wells_with_data: set[str] = set()
-        self._selected_wells: set[str] = set()
+        # Only replaced, in set_data; shared as the "select all" selection
+        self._wells_with_data: frozenset[str] = frozenset()
+        # Replaced, never mutated, so it can be emitted and shared as is
+        self._selected_wells: frozenset[str] = frozenset()
         self._sample_names: dict[str, str] = {}
         self._sample_colors: dict[str, QColor] = {}
         self._inactive_wells: set[str] = set()
         self._hovered_well: str | None = None
+        # Cell geometry and per-well centres/rects, rebuilt after a resize
+        self._geometry: tuple[float, float, float] | None = None
+        self._well_centers: list[list[QPointF]] = []
+        self._well_rects: list[list[QRectF]] = []
+        # Flat indices of wells with data, and (x, y) of every well centre by
+        # flat index, for vectorised rubber-band hit tests
+        self._data_indices = np.empty(0, dtype=np.intp)
+        self._center_xy = np.empty((0, 2))
+        self._hit_r2 = 0.0     # squared well radius, for hover hit tests
+        # Wells with data in each plate row / column, for label clicks
+        self._row_wells: list[frozenset[str]] = [frozenset()] * self.ROWS
+        self._col_wells: list[frozenset[str]] = [frozenset()] * self.COLS
+        # (pen, brush) per distinct well look, shared across wells and paints;
+        # keyed by sample colour rgba and the has_data/selected/hovered/
+        # inactive flags
+        self._style_cache: dict[tuple, tuple[QPen, QBrush]] = {}
+        self._font: QFont | None = None
 
         # Drag / rubber-band state
         self._drag_start: QPointF | None = None
         self._drag_active: bool = False
         self._drag_current: QPointF | None = None
-        self._pre_drag_selection: set[str] = set()
+        self._pre_drag_selection: frozenset[str] = frozenset()
 
         self.setMouseTracking(True)
         self.setMinimumSize(300, 220)
@@ -45,20 +82,37 @@ class PlateMapWidget(QWidget):
     # -- Public API ----------------------------------------------------------
 
     def set_data(self, wells: list[str], sample_names: dict[str, str]):
-        self._wells_with_data = set(wells)
+        self._wells_with_data = frozenset(wells)
+        self._data_indices = np.array(
+            sorted(r * self.COLS + c for r, c in
+                   (self._WELL_RC[w] for w in self._wells_with_data
+                    if w in self._WELL_RC)),
+            dtype=np.intp,
+        )
+        with_data = self._wells_with_data
+        self._row_wells = [
+            frozenset(w for w in names if w in with_data)
+            for names in self.WELL_NAMES
+        ]
+        self._col_wells = [
+            frozenset(w for w in names if w in with_data)
+            for names in zip(*self.WELL_NAMES)
+        ]
         self._sample_names = dict(sample_names)
         self.update()
 
     def set_selection(self, wells: set[str]):
+        """Select *wells*; never mutated, and a frozenset is kept without copying."""
         if wells != self._selected_wells:
-            self._selected_wells = set(wells)
+            self._selected_wells = frozenset(wells)
             self.update()
 
-    def get_selection(self) -> set[str]:
-        return set(self._selected_wells)
+    def get_selection(self) -> frozenset[str]:
+        return self._selected_wells
 
     def set_sample_colors(self, colors: dict[str, QColor]):
-        self._sample_colors = dict(colors)
+        """Use *colors* for painting; the dict is kept, not copied or mutated."""
+        self._sample_colors = colors
         self.update()
 
     def set_inactive_wells(self, wells: set[str]):
@@ -82,73 +136,141 @@ class PlateMapWidget(QWidget):
         offset_y = self.LABEL_MARGIN + self.PADDING + (avail_h - grid_h) / 2
         return cell_size, offset_x, offset_y
 
-    def _well_center(self, row: int, col: int) -> tuple[float, float]:
-        cell_size, ox, oy = self._cell_geometry()
-        return ox + (col + 0.5) * cell_size, oy + (row + 0.5) * cell_size
-
-    def _well_rect(self, row: int, col: int) -> QRectF:
-        cell_size, ox, oy = self._cell_geometry()
-        d = cell_size * 0.78
-        cx, cy = self._well_center(row, col)
-        return QRectF(cx - d / 2, cy - d / 2, d, d)
+    def _cached_geometry(self) -> tuple[float, float, float]:
+        if self._geometry is None:
+            cell_size, ox, oy = self._geometry = self._cell_geometry()
+            d = cell_size * 0.78
+            self._well_centers = [
+                [QPointF(ox + (col + 0.5) * cell_size, oy + (row + 0.5) * cell_size)
+                 for col in range(self.COLS)]
+                for row in range(self.ROWS)
+            ]
+            self._well_rects = [
+                [QRectF(c.x() - d / 2, c.y() - d / 2, d, d) for c in centers]
+                for centers in self._well_centers
+            ]
+            self._center_xy = np.array(
+                [(c.x(), c.y()) for centers in self._well_centers for c in centers]
+            )
+            self._hit_r2 = (d / 2) ** 2
+        return self._geometry
+
+    def _well_area(self, well: str | None) -> QRectF:
+        """Area repainted when *well* changes look, including its border."""
+        rc = self._WELL_RC.get(well)
+        if rc is None:
+            return QRectF()
+        self._cached_geometry()
+        m = self.WELL_PAINT_MARGIN
+        return self._well_rects[rc[0]][rc[1]].adjusted(-m, -m, m, m)
+
+    def resizeEvent(self, event):
+        self._geometry = None
+        super().resizeEvent(event)
+
+    def showEvent(self, event):
+        self._geometry = None
+        super().showEvent(event)
 
     @staticmethod
     def _rc_to_well(row: int, col: int) -> str:
-        return f"{chr(ord('A') + row)}{col + 1}"
+        return PlateMapWidget.WELL_NAMES[row][col]
 
     def _well_at_pos(self, pos: QPointF) -> tuple[int, int] | None:
-        cell_size, ox, oy = self._cell_geometry()
+        cell_size, ox, oy = self._cached_geometry()
         if cell_size <= 0:
             return None
         col = int((pos.x() - ox) / cell_size)
         row = int((pos.y() - oy) / cell_size)
         if 0 <= row < self.ROWS and 0 <= col < self.COLS:
-            rect = self._well_rect(row, col)
-            c = rect.center()
+            c = self._well_centers[row][col]
             dx, dy = pos.x() - c.x(), pos.y() - c.y()
-            r = rect.width() / 2
-            if dx * dx + dy * dy <= r * r:
+            if dx * dx + dy * dy <= self._hit_r2:
                 return (row, col)
         return None
 
+    # Cells are uniformly spaced, so a label's row / column follows directly
+    # from the offset along the grid
+
     def _row_label_at_pos(self, pos: QPointF) -> int | None:
-        cell_size, ox, oy = self._cell_geometry()
-        if pos.x() >= ox:
+        cell_size, ox, oy = self._cached_geometry()
+        if pos.x() >= ox or cell_size <= 0:
             return None
-        for row in range(self.ROWS):
-            cy = oy + (row + 0.5) * cell_size
-            if abs(pos.y() - cy) < cell_size / 2:
-                return row
-        return None
+        row = math.floor((pos.y() - oy) / cell_size)
+        return row if 0 <= row < self.ROWS else None
 
     def _col_label_at_pos(self, pos: QPointF) -> int | None:
-        cell_size, ox, oy = self._cell_geometry()
-        if pos.y() >= oy:
+        cell_size, ox, oy = self._cached_geometry()
+        if pos.y() >= oy or cell_size <= 0:
             return None
-        for col in range(self.COLS):
-            cx = ox + (col + 0.5) * cell_size
-            if abs(pos.x() - cx) < cell_size / 2:
-                return col
-        return None
+        col = math.floor((pos.x() - ox) / cell_size)
+        return col if 0 <= col < self.COLS else None
 
     # -- Painting ------------------------------------------------------------
 
+    def _well_style(self, sc: QColor | None, has_data: bool, is_sel: bool,
+                    is_hover: bool, is_inactive: bool) -> tuple[QPen, QBrush]:
+        """Border pen and fill brush for a well in the given state."""
+        # Determine fill and border
+        if not has_data:
+            fill = QColor(220, 220, 220)
+            border = QColor(180, 180, 180)
+            bw = 1.0
+        elif is_inactive:
+            # Inactive wells: desaturated/faded version of their normal color
+            if sc is not None:
+                fill = QColor(sc.red(), sc.green(), sc.blue(), 60)
+                border = QColor(sc.red(), sc.green(), sc.blue(), 100)
+            elif is_sel:
+                fill = QColor(0, 0, 0, 60)
+                border = QColor(0, 0, 0, 100)
+            else:
+                fill = QColor(240, 240, 240)
+                border = QColor(180, 180, 180)
+            bw = 1.0
+        elif sc is not None:
+            # Sample-coloured well
+            if is_sel:
+                fill = QColor(sc.red(), sc.green(), sc.blue(),
+                              max(sc.alpha(), 160))
+                border = QColor(sc.red(), sc.green(), sc.blue()).darker(130)
+            else:
+                fill = QColor(255, 255, 255)
+                border = QColor(sc.red(), sc.green(), sc.blue())
+            bw = 2.0
+        elif is_sel:
+            fill = QColor(0, 0, 0)
+            border = QColor(0, 0, 0)
+            bw = 1.5
+        else:
+            fill = QColor(255, 255, 255)
+            border = QColor(0, 0, 0)
+            bw = 1.0
+
+        if is_hover and has_data:
+            border = border.lighter(140) if sc else QColor(80, 80, 80)
+            bw = max(bw, 2.5)
+
+        return QPen(border, bw), QBrush(fill)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.fillRect(self.rect(), QColor(255, 255, 255))
+        painter.fillRect(self.rect(), self.COLOR_BACKGROUND)
 
-        cell_size, ox, oy = self._cell_geometry()
+        cell_size, ox, oy = self._cached_geometry()
         if cell_size <= 0:
             painter.end()
             return
 
-        font = QFont()
-        font.setPointSize(max(7, int(cell_size * 0.3)))
-        painter.setFont(font)
+        point_size = max(7, int(cell_size * 0.3))
+        if self._font is None or self._font.pointSize() != point_size:
+            self._font = QFont()
+            self._font.setPointSize(point_size)
+        painter.setFont(self._font)
 
         # Column labels
-        painter.setPen(QColor(0, 0, 0))
+        painter.setPen(self.COLOR_LABEL)
         for col in range(self.COLS):
             cx = ox + (col + 0.5) * cell_size
             r = QRectF(cx - cell_size / 2, 0, cell_size, self.LABEL_MARGIN)
@@ -160,77 +282,67 @@ class PlateMapWidget(QWidget):
             r = QRectF(0, cy - cell_size / 2, self.LABEL_MARGIN, cell_size)
             painter.drawText(r, Qt.AlignmentFlag.AlignCenter, self.ROW_LABELS[row])
 
-        # Wells
+        # Wells; those wholly outside the exposed area are skipped
+        m = self.WELL_PAINT_MARGIN
+        exposed = QRectF(event.rect()).adjusted(-m, -m, m, m)
+        well_names = self.WELL_NAMES
+        well_rects = self._well_rects
+        style_cache = self._style_cache
+        # Widget state read for every well, bound once as locals
+        with_data = self._wells_with_data
+        selected = self._selected_wells
+        hovered = self._hovered_well
+        inactive = self._inactive_wells
+        sample_colors = self._sample_colors
+        # Wells are grouped by look so pen and brush are set once per group
+        groups: dict[tuple, list[QRectF]] = {}
+        crossed: list[QRectF] = []
         for row in range(self.ROWS):
             for col in range(self.COLS):
-                well = self._rc_to_well(row, col)
-                rect = self._well_rect(row, col)
-                has_data = well in self._wells_with_data
-                is_sel = well in self._selected_wells
-                is_hover = well == self._hovered_well
-                is_inactive = well in self._inactive_wells
-                sc = self._sample_colors.get(well)
-
-                # Determine fill and border
-                if not has_data:
-                    fill = QColor(220, 220, 220)
-                    border = QColor(180, 180, 180)
-                    bw = 1.0
-                elif is_inactive:
-                    # Inactive wells: desaturated/faded version of their normal color
-                    if sc is not None:
-                        fill = QColor(sc.red(), sc.green(), sc.blue(), 60)
-                        border = QColor(sc.red(), sc.green(), sc.blue(), 100)
-                    elif is_sel:
-                        fill = QColor(0, 0, 0, 60)
-                        border = QColor(0, 0, 0, 100)
-                    else:
-                        fill = QColor(240, 240, 240)
-                        border = QColor(180, 180, 180)
-                    bw = 1.0
-                elif sc is not None:
-                    # Sample-coloured well
-                    if is_sel:
-                        fill = QColor(sc.red(), sc.green(), sc.blue(),
-                                      max(sc.alpha(), 160))
-                        border = QColor(sc.red(), sc.green(), sc.blue()).darker(130)
-                    else:
-                        fill = QColor(255, 255, 255)
-                        border = QColor(sc.red(), sc.green(), sc.blue())
-                    bw = 2.0
-                elif is_sel:
-                    fill = QColor(0, 0, 0)
-                    border = QColor(0, 0, 0)
-                    bw = 1.5
-                else:
-                    fill = QColor(255, 255, 255)
-                    border = QColor(0, 0, 0)
-                    bw = 1.0
-
-                if is_hover and has_data:
-                    border = border.lighter(140) if sc else QColor(80, 80, 80)
-                    bw = max(bw, 2.5)
-
-                painter.setPen(QPen(border, bw))
-                painter.setBrush(fill)
+                rect = well_rects[row][col]
+                if not rect.intersects(exposed):
+                    continue
+                well = well_names[row][col]
+                has_data = well in with_data
+                is_sel = well in selected
+                is_hover = well == hovered
+                is_inactive = well in inactive
+                sc = sample_colors.get(well)
+
+                key = (sc.rgba() if sc is not None else None,
+                       has_data, is_sel, is_hover, is_inactive)
+                rects = groups.get(key)
+                if rects is None:
+                    rects = groups[key] = []
+                    if key not in style_cache:
+                        style_cache[key] = self._well_style(
+                            sc, has_data, is_sel, is_hover, is_inactive)
+                rects.append(rect)
+                if is_inactive and has_data:
+                    crossed.append(rect)
+
+        for key, rects in groups.items():
+            pen, brush = style_cache[key]
+            painter.setPen(pen)
+            painter.setBrush(brush)
+            for rect in rects:
                 painter.drawEllipse(rect)
 
-                # Draw diagonal cross for inactive wells
-                if is_inactive and has_data:
-                    cross_pen = QPen(QColor(180, 0, 0, 160), 1.5)
-                    painter.setPen(cross_pen)
-                    r = rect.width() / 2 * 0.6
-                    cx, cy = rect.center().x(), rect.center().y()
-                    painter.drawLine(
-                        QPointF(cx - r, cy - r), QPointF(cx + r, cy + r))
-                    painter.drawLine(
-                        QPointF(cx - r, cy + r), QPointF(cx + r, cy - r))
+        # Diagonal cross over inactive wells, drawn inside the well outline
+        painter.setPen(self.CROSS_PEN)
+        for rect in crossed:
+            r = rect.width() / 2 * 0.6
+            cx, cy = rect.center().x(), rect.center().y()
+            painter.drawLine(
+                QPointF(cx - r, cy - r), QPointF(cx + r, cy + r))
+            painter.drawLine(
+                QPointF(cx - r, cy + r), QPointF(cx + r, cy - r))
 
         # Rubber-band rectangle
         if self._drag_active and self._drag_start and self._drag_current:
             band = QRectF(self._drag_start, self._drag_current).normalized()
-            painter.setPen(QPen(QColor(0, 0, 0), 1, Qt.PenStyle.DashLine))
-            painter.setBrush(QColor(0, 0, 0, 30))
+            painter.setPen(self.BAND_PEN)
+            painter.setBrush(self.BAND_BRUSH)
             painter.drawRect(band)
 
         painter.end()
@@ -242,15 +354,20 @@ class PlateMapWidget(QWidget):
             self._drag_start = event.position()
             self._drag_active = False
             self._drag_current = None
-            self._pre_drag_selection = set(self._selected_wells)
+            self._pre_drag_selection = self._selected_wells
 
     def mouseMoveEvent(self, event):
         pos = event.position()
+        # Repaint once at the end, and only if something visible changed
+        dirty = False
 
         rc = self._well_at_pos(pos)
         new_hover = self._rc_to_well(*rc) if rc else None
         if new_hover != self._hovered_well:
+            hover_area = self._well_area(self._hovered_well).united(
+                self._well_area(new_hover))
             self._hovered_well = new_hover
+            dirty = True
             if new_hover and new_hover in self._wells_with_data:
                 sample = self._sample_names.get(new_hover, "")
                 tip = new_hover
@@ -261,7 +378,6 @@ class PlateMapWidget(QWidget):
                 )
             else:
                 QToolTip.hideText()
-            self.update()
 
         if event.buttons() & Qt.MouseButton.LeftButton and self._drag_start:
             if not self._drag_active:
@@ -270,22 +386,28 @@ class PlateMapWidget(QWidget):
                 if dx * dx + dy * dy > 25:
                     self._drag_active = True
 
-            if self._drag_active:
+            if self._drag_active and pos != self._drag_current:
                 self._drag_current = pos
+                dirty = True   # the band outline moved
                 band = QRectF(self._drag_start, self._drag_current).normalized()
-                drag_wells: set[str] = set()
-                for r in range(self.ROWS):
-                    for c in range(self.COLS):
-                        w = self._rc_to_well(r, c)
-                        if w in self._wells_with_data:
-                            cx, cy = self._well_center(r, c)
-                            if band.contains(QPointF(cx, cy)):
-                                drag_wells.add(w)
+                self._cached_geometry()
+                idx = self._data_indices
+                xs, ys = self._center_xy[idx].T
+                inside = ((xs >= band.left()) & (xs <= band.right())
+                          & (ys >= band.top()) & (ys <= band.bottom()))
+                names = self.WELL_NAMES_FLAT
+                drag_wells = {names[i] for i in idx[inside].tolist()}
                 if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
-                    self._selected_wells = self._pre_drag_selection | drag_wells
-                else:
-                    self._selected_wells = drag_wells
+                    drag_wells |= self._pre_drag_selection
+                if drag_wells != self._selected_wells:
+                    self._selected_wells = frozenset(drag_wells)
+
+        if dirty:
+            if self._drag_active:
                 self.update()
+            else:
+                # Only the wells entering and leaving hover change look
+                self.update(hover_area.toAlignedRect())
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -294,28 +416,24 @@ class PlateMapWidget(QWidget):
 
                 row = self._row_label_at_pos(pos)
                 if row is not None:
-                    row_wells = {
-                        self._rc_to_well(row, c) for c in range(self.COLS)
-                    } & self._wells_with_data
+                    row_wells = self._row_wells[row]
                     if row_wells and row_wells <= self._selected_wells:
                         self._selected_wells -= row_wells
                     else:
                         self._selected_wells |= row_wells
-                    self.selectionChanged.emit(set(self._selected_wells))
+                    self.selectionChanged.emit(self._selected_wells)
                     self.update()
                     self._drag_start = None
                     return
 
                 col = self._col_label_at_pos(pos)
                 if col is not None:
-                    col_wells = {
-                        self._rc_to_well(r, col) for r in range(self.ROWS)
-                    } & self._wells_with_data
+                    col_wells = self._col_wells[col]
                     if col_wells and col_wells <= self._selected_wells:
                         self._selected_wells -= col_wells
                     else:
                         self._selected_wells |= col_wells
-                    self.selectionChanged.emit(set(self._selected_wells))
+                    self.selectionChanged.emit(self._selected_wells)
                     self.update()
                     self._drag_start = None
                     return
@@ -324,14 +442,13 @@ class PlateMapWidget(QWidget):
                 if rc:
                     well = self._rc_to_well(*rc)
                     if well in self._wells_with_data:
-                        if well in self._selected_wells:
-                            self._selected_wells.discard(well)
-                        else:
-                            self._selected_wells.add(well)
-                        self.selectionChanged.emit(set(self._selected_wells))
+                        self._selected_wells ^= {well}
+                        self.selectionChanged.emit(self._selected_wells)
                         self.update()
-            else:
-                self.selectionChanged.emit(set(self._selected_wells))
+            elif self._selected_wells != self._pre_drag_selection:
+                # A drag only repaints locally while moving; other views
+                # sync once here, and not at all if the gesture was a no-op
+                self.selectionChanged.emit(self._selected_wells)
 
             self._drag_start = None
             self._drag_active = False
@@ -343,20 +460,20 @@ class PlateMapWidget(QWidget):
     def keyPressEvent(self, event):
         ctrl = event.modifiers() & Qt.KeyboardModifier.ControlModifier
         if event.key() == Qt.Key.Key_A and ctrl:
-            self._selected_wells = set(self._wells_with_data)
-            self.selectionChanged.emit(set(self._selected_wells))
+            self._selected_wells = self._wells_with_data
+            self.selectionChanged.emit(self._selected_wells)
             self.update()
         elif event.key() == Qt.Key.Key_D and ctrl:
-            self._selected_wells = set()
-            self.selectionChanged.emit(set(self._selected_wells))
+            self._selected_wells = frozenset()
+            self.selectionChanged.emit(self._selected_wells)
             self.update()
         elif event.key() == Qt.Key.Key_Escape:
-            self._selected_wells = set()
-            self.selectionChanged.emit(set(self._selected_wells))
+            self._selected_wells = frozenset()
+            self.selectionChanged.emit(self._selected_wells)
             self.update()
         elif event.key() == Qt.Key.Key_I and ctrl:
             self._selected_wells = self._wells_with_data - self._selected_wells
-            self.selectionChanged.emit(set(self._selected_wells))
+            self.selectionChanged.emit(self._selected_wells)
             self.update()
         else:
             super().keyPressEvent(event)
@@ -393,9 +510,9 @@ class PlateMapWidget(QWidget):
             return
 
         if action is act_all:
-            self._selected_wells = set(self._wells_with_data)
+            self._selected_wells = self._wells_with_data
         elif action is act_none:
-            self._selected_wells = set()
+            self._selected_wells = frozenset()
         elif action is act_inv:
             self._selected_wells = self._wells_with_data - self._selected_wells
         elif action is act_color:
@@ -411,5 +528,5 @@ class PlateMapWidget(QWidget):
             self.reactivateRequested.emit(set(self._selected_wells))
             return
 
-        self.selectionChanged.emit(set(self._selected_wells))
+        self.selectionChanged.emit(self._selected_wells)
         self.update()
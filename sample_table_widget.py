@@ -1,12 +1,167 @@
 """Sample list table widget with selection sync."""
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem
-from PySide6.QtCore import Qt, Signal, QItemSelection, QItemSelectionModel
+import numpy as np
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QTableView
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractTableModel, QModelIndex, QItemSelection,
+    QItemSelectionModel,
+)
 from PySide6.QtGui import QColor
 
 from lc480_parser import LC480Data
+from baseline import BaselineResults, CALL_LABELS
 
 
+# ---------------------------------------------------------------------------
+# SampleTableModel – read-only rows backed by the loaded data
+# ---------------------------------------------------------------------------
+
+class SampleTableModel(QAbstractTableModel):
+    """Well / sample name / Ct / Call / RFI rows, one per well.
+
+    Every column is kept as one list of strings in row order. Ct, Call and
+    RFI of the current channel are sliced out of the baseline result arrays
+    and formatted once per update; an update that leaves the text as it was
+    emits nothing.
+    """
+
+    HEADERS = ["Well", "Sample Name", "Ct", "Call", "Endpoint RFI"]
+    COL_CT = 2
+    COL_CALL = 3
+    COL_RFI = 4
+
+    INACTIVE_FG = QColor(180, 180, 180)
+    # Read-only but selectable, the same for every cell
+    ITEM_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._wells: tuple[str, ...] = ()
+        self._row_of: dict[str, int] = {}   # well -> row
+        self._names: list[str] = []
+        self._inactive: list[bool] = []
+        # Results the row map below was built for
+        self._results: BaselineResults | None = None
+        self._result_rows = np.empty(0, dtype=np.intp)  # row -> results well
+        self._has_result: list[bool] = []               # row is in results
+        # Ct / Call / RFI text by row, or None when no results are shown
+        self._result_texts: tuple[list[str], list[str], list[str]] | None = None
+
+    # -- Qt model API --------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._wells)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            col = index.column()
+            if col == 0:
+                return self._wells[row]
+            if col == 1:
+                return self._names[row]
+            return self._result_text(row, col)
+        if role == Qt.ItemDataRole.ForegroundRole and self._inactive[row]:
+            return self.INACTIVE_FG
+        return None
+
+    def _result_text(self, row: int, col: int) -> str:
+        if self._result_texts is None:
+            return ""
+        return self._result_texts[col - self.COL_CT][row]
+
+    def flags(self, index):
+        return self.ITEM_FLAGS
+
+    # -- Updates -------------------------------------------------------------
+
+    def set_data(self, data: LC480Data):
+        self.beginResetModel()
+        self._wells = data.wells
+        self._row_of = data.well_idx
+        self._names = [data.sample_names.get(w, "") for w in self._wells]
+        self._inactive = [False] * len(self._wells)
+        self._results = None
+        self._result_texts = None
+        self.endResetModel()
+
+    def set_baseline(self, results: BaselineResults | None,
+                     channel: str | None) -> bool:
+        """Show Ct/Call/RFI of *channel* from *results* (or blank cells).
+
+        Returns whether any cell text changed.
+        """
+        texts = None
+        if results is not None and channel is not None:
+            if results is not self._results:
+                well_idx = results.well_idx
+                idx = [well_idx.get(w, -1) for w in self._wells]
+                self._result_rows = np.array(idx, dtype=np.intp)
+                self._has_result = [i >= 0 for i in idx]
+                self._results = results
+            texts = self._format_results(results, channel)
+        if texts == self._result_texts:
+            return False
+        self._result_texts = texts
+        if self._wells:
+            self.dataChanged.emit(
+                self.index(0, self.COL_CT),
+                self.index(len(self._wells) - 1, self.COL_RFI),
+                [Qt.ItemDataRole.DisplayRole],
+            )
+        return True
+
+    def _format_results(self, results: BaselineResults, channel: str,
+                        ) -> tuple[list[str], list[str], list[str]]:
+        """Ct, Call and RFI text of *channel* for every row."""
+        n = len(self._wells)
+        c = results.channel_idx.get(channel)
+        if c is None or not results.wells:
+            return [""] * n, ["N/A"] * n, [""] * n
+        # One gather per column; rows missing from results read the last
+        # well but are blanked via _has_result
+        rows = self._result_rows
+        has = self._has_result
+        ct = results.ct[rows, c].tolist()
+        call = results.call[rows, c].tolist()
+        rfi = results.endpoint_rfi[rows, c].tolist()
+        return (
+            [f"{v:.2f}" if h and v == v else "" for v, h in zip(ct, has)],
+            [CALL_LABELS[k] if h else "N/A" for k, h in zip(call, has)],
+            [f"{v:.3f}" if h and v == v else "" for v, h in zip(rfi, has)],
+        )
+
+    def set_inactive_wells(self, wells: set[str]):
+        self._inactive = [w in wells for w in self._wells]
+        if self._wells:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._wells) - 1, len(self.HEADERS) - 1),
+                [Qt.ItemDataRole.ForegroundRole],
+            )
+
+    def well_at(self, row: int) -> str:
+        return self._wells[row]
+
+    def rows_of(self, wells) -> list[int]:
+        """Sorted rows of those *wells* that are in the table."""
+        row_of = self._row_of
+        return sorted(row_of[w] for w in wells if w in row_of)
+
+
+# ---------------------------------------------------------------------------
+# SampleTableWidget
+# ---------------------------------------------------------------------------
+
 class SampleTableWidget(QWidget):
     """Table showing well positions, sample names, with multi-row selection."""
 
@@ -16,21 +171,24 @@ class SampleTableWidget(QWidget):
         super().__init__(parent)
         self._data: LC480Data | None = None
         self._syncing = False
+        # Wells currently selected in the view, whoever selected them;
+        # None when unknown (e.g. after a model reset)
+        self._shown_selection: set[str] | None = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Well", "Sample Name", "Ct", "Call", "Endpoint RFI"])
+        self.model = SampleTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QTableView.SelectionBehavior.SelectRows
         )
         self.table.setSelectionMode(
-            QTableWidget.SelectionMode.MultiSelection
+            QTableView.SelectionMode.MultiSelection
         )
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
         layout.addWidget(self.table)
 
@@ -41,97 +199,86 @@ class SampleTableWidget(QWidget):
     def set_data(self, data: LC480Data):
         """Populate the table with well and sample name data."""
         self._syncing = True
-        self._data = data
-        self.table.setRowCount(len(data.wells))
-        for i, well in enumerate(data.wells):
-            well_item = QTableWidgetItem(well)
-            well_item.setFlags(well_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            name_item = QTableWidgetItem(data.sample_names.get(well, ""))
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            ct_item = QTableWidgetItem("")
-            ct_item.setFlags(ct_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            call_item = QTableWidgetItem("")
-            call_item.setFlags(call_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            rfi_item = QTableWidgetItem("")
-            rfi_item.setFlags(rfi_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(i, 0, well_item)
-            self.table.setItem(i, 1, name_item)
-            self.table.setItem(i, 2, ct_item)
-            self.table.setItem(i, 3, call_item)
-            self.table.setItem(i, 4, rfi_item)
-        self.table.resizeColumnToContents(0)
-        self.table.resizeColumnToContents(2)
-        self.table.resizeColumnToContents(3)
-        self.table.resizeColumnToContents(4)
-        self._syncing = False
+        # One repaint after the reset and column fits, not one per step
+        self.table.setUpdatesEnabled(False)
+        try:
+            self._data = data
+            self._shown_selection = None
+            self.model.set_data(data)
+            for col in (0, 2, 3, 4):
+                self.table.resizeColumnToContents(col)
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self._syncing = False
 
     def set_selection(self, wells: set[str]):
-        """Set selected rows to match the given well set (for external sync)."""
+        """Set selected rows to match the given well set (for external sync).
+
+        *wells* is only read, so callers may share one set between views.
+        Rows come from the model's well -> row map; nothing is done if the
+        view already shows exactly *wells*, and only the rows that differ
+        are touched if the current selection is known.
+        """
+        shown = self._shown_selection
+        if wells == shown:
+            return
+        if shown is not None:
+            self._select_delta(wells - shown, shown - wells)
+            self._shown_selection = wells
+            return
+        self._shown_selection = wells
         self._syncing = True
-        selection = QItemSelection()
-        model = self.table.model()
-        last_col = self.table.columnCount() - 1
-        for i in range(self.table.rowCount()):
-            item = self.table.item(i, 0)
-            if item and item.text() in wells:
-                selection.select(model.index(i, 0), model.index(i, last_col))
         self.table.selectionModel().select(
-            selection, QItemSelectionModel.SelectionFlag.ClearAndSelect
+            self._row_selection(wells),
+            QItemSelectionModel.SelectionFlag.ClearAndSelect,
         )
         self._syncing = False
 
-    def set_ct_call(self, ct_data: dict[str, float | None],
-                    call_data: dict[str, str],
-                    rfi_data: dict[str, float | None] | None = None):
-        """Update the Ct, Call, and Endpoint RFI columns for each well."""
-        for i in range(self.table.rowCount()):
-            well_item = self.table.item(i, 0)
-            if not well_item:
-                continue
-            well = well_item.text()
-
-            ct_val = ct_data.get(well)
-            ct_text = f"{ct_val:.2f}" if ct_val is not None else ""
-            ct_item = self.table.item(i, 2)
-            if ct_item:
-                ct_item.setText(ct_text)
-
-            call_val = call_data.get(well, "")
-            call_item = self.table.item(i, 3)
-            if call_item:
-                call_item.setText(call_val)
-
-            if rfi_data is not None:
-                rfi_val = rfi_data.get(well)
-                rfi_text = f"{rfi_val:.3f}" if rfi_val is not None else ""
-                rfi_item = self.table.item(i, 4)
-                if rfi_item:
-                    rfi_item.setText(rfi_text)
-
-        self.table.resizeColumnToContents(2)
-        self.table.resizeColumnToContents(3)
-        self.table.resizeColumnToContents(4)
+    def _select_delta(self, added: set[str], removed: set[str]):
+        flag = QItemSelectionModel.SelectionFlag
+        model = self.table.selectionModel()
+        self._syncing = True
+        if removed:
+            model.select(self._row_selection(removed), flag.Deselect)
+        if added:
+            model.select(self._row_selection(added), flag.Select)
+        self._syncing = False
+
+    def _row_selection(self, wells) -> QItemSelection:
+        """Full-width rows of *wells*, one range per run of consecutive rows."""
+        selection = QItemSelection()
+        last_col = self.model.columnCount() - 1
+        rows = self.model.rows_of(wells)
+        start = 0
+        for k in range(1, len(rows) + 1):
+            if k == len(rows) or rows[k] != rows[k - 1] + 1:
+                selection.select(self.model.index(rows[start], 0),
+                                 self.model.index(rows[k - 1], last_col))
+                start = k
+        return selection
+
+    def set_baseline(self, results: BaselineResults | None,
+                     channel: str | None):
+        """Show Ct, Call, and Endpoint RFI of *channel* for each well."""
+        self.table.setUpdatesEnabled(False)
+        try:
+            # Column widths only need refitting if some text changed
+            if self.model.set_baseline(results, channel):
+                for col in (2, 3, 4):
+                    self.table.resizeColumnToContents(col)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def set_inactive_wells(self, wells: set[str]):
         """Grey out rows for inactive wells."""
-        inactive_fg = QColor(180, 180, 180)
-        normal_fg = QColor(0, 0, 0)
-        for i in range(self.table.rowCount()):
-            well_item = self.table.item(i, 0)
-            if not well_item:
-                continue
-            fg = inactive_fg if well_item.text() in wells else normal_fg
-            for col in range(self.table.columnCount()):
-                item = self.table.item(i, col)
-                if item:
-                    item.setForeground(fg)
+        self.model.set_inactive_wells(wells)
 
     def _on_selection_changed(self):
         if self._syncing:
             return
-        selected_wells: set[str] = set()
-        for index in self.table.selectionModel().selectedRows(0):
-            item = self.table.item(index.row(), 0)
-            if item:
-                selected_wells.add(item.text())
+        selected_wells = {
+            self.model.well_at(index.row())
+            for index in self.table.selectionModel().selectedRows(0)
+        }
+        self._shown_selection = selected_wells
         self.selectionChanged.emit(selected_wells)